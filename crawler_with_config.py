@@ -4,25 +4,79 @@ Futbin Crawler with JSON Configuration
 Reads player links from player_links.json and extracts market data
 """
 
+import asyncio
 import json
 import time
 import csv
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
+import queue
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, List, Dict, Optional, Tuple
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import sqlite3
+from operator import itemgetter
 
 from futbin_crawler_working import FutbinCrawler
+from page_cache import PageCache
+from price_history import PriceHistory
 
 # Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+WRITE_BUFFER_SIZE = 1 << 20
+
+# CSV header -> key in the extraction data; the url column comes from the result itself
+CSV_FIELDS = [
+    ('timestamp', 'timestamp'), ('player_name', 'player_name'), ('configured_name', 'configured_name'),
+    ('card_type', 'card_type'), ('card_rarity', 'card_rarity'), ('overall_rating', 'overall_rating'),
+    ('position', 'position'), ('cheapest_sale', 'cheapest_sale'), ('average_bin', 'actual_price'),
+    ('ea_avg_price', 'average_price'), ('notes', 'notes')
+]
+CSV_HEADERS = [header for header, _ in CSV_FIELDS] + ['url']
+_NA = "N/A"
+# Shared empty mapping for lookups that fall back to "no entry" (never mutated)
+_NO_ENTRY: Dict = {}
+
+
+def _format_price(value: Optional[int]) -> str:
+    """Format integer price values with thousands separator"""
+    return _NA if value is None else format(value, ',')
+
+
+class _RateLimiter:
+    """
+    Spaces request starts at least ``1 / rate`` seconds apart
+
+    Only used from the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_start = 0.0
+
+    async def wait(self):
+        """Sleep until the next request slot is available"""
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
 
 class ConfiguredFutbinCrawler:
     """
     Futbin crawler that uses JSON configuration file
     """
+
+    # Parsed configuration files keyed by path -> (mtime_ns, size, config)
+    _CONFIG_CACHE: Dict[str, Tuple[int, int, Dict]] = {}
     
     def __init__(self, config_file: str = "player_links.json"):
         """
@@ -32,46 +86,114 @@ class ConfiguredFutbinCrawler:
             config_file: Path to JSON configuration file
         """
         self.config_file = config_file
-        self.config = self._load_config()
-        self.settings = self.config.get('settings', {})
-        self.players = self.config.get('players', [])
+        self._apply_config(self._load_config())
         
-        # Initialize the crawler
+        # Recently extracted pages are reused for cache_ttl_seconds (0 disables the cache)
+        cache_ttl = float(self.settings.get('cache_ttl_seconds', 0))
+        self._page_cache: Optional[PageCache] = PageCache(cache_ttl) if cache_ttl > 0 else None
+
+        # Initialize the crawler (cache hits are served by the crawlers themselves)
         headless = self.settings.get('headless_mode', False)
-        self.crawler = FutbinCrawler(headless=headless)
+        self.crawler = FutbinCrawler(headless=headless, page_cache=self._page_cache)
+        self._extra_crawlers: List[FutbinCrawler] = []
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
+        # Saves requested by the monitor loop run on a background writer thread
+        self._write_queue: queue.Queue = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
         
-        logger.info(f"Loaded configuration from {config_file}")
-        logger.info(f"Found {len(self.players)} players, {sum(1 for p in self.players if p.get('enabled', True))} enabled")
+        logger.info("Loaded configuration from %s", config_file)
+        logger.info("Found %d players, %d enabled", len(self.players), len(self._enabled_players))
     
     def _load_config(self) -> Dict:
-        """Load configuration from JSON file"""
+        """
+        Load configuration from JSON file
+
+        The parsed configuration is cached by file modification time and size,
+        so unchanged files are not re-parsed. The returned dict is shared with
+        the cache and must be treated as read-only.
+        """
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            stat = os.stat(self.config_file)
+            cache_key = os.path.abspath(self.config_file)
+            cached = self._CONFIG_CACHE.get(cache_key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+
+            # One binary read; json.loads detects the encoding (UTF-8, with or without BOM)
+            with open(self.config_file, 'rb') as f:
+                config = json.loads(f.read())
+
+            self._CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+            return config
         except FileNotFoundError:
-            logger.error(f"Configuration file {self.config_file} not found!")
+            logger.error("Configuration file %s not found!", self.config_file)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"Error parsing JSON configuration: {e}")
+            logger.error("Error parsing JSON configuration: %s", e)
             raise
     
     def reload_config(self):
-        """Reload configuration from file"""
-        self.config = self._load_config()
-        self.settings = self.config.get('settings', {})
-        self.players = self.config.get('players', [])
+        """Reload configuration from file if it changed on disk"""
+        config = self._load_config()
+        if config is self.config:
+            return
+        self._apply_config(config)
         logger.info("Configuration reloaded")
+
+    def _apply_config(self, config: Dict):
+        """Expose a loaded configuration and precompute the enabled player list"""
+        self.config = config
+        self.settings = config.get('settings', {})
+        self.players = config.get('players', [])
+        self._enabled_players = [p for p in self.players if p.get('enabled', True)]
+    
+    def _config_signature(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the configuration file, or None if unavailable"""
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _wait_for_next_cycle(self, timeout: float, poll_interval: float = 1.0) -> bool:
+        """
+        Sleep for up to ``timeout`` seconds between monitoring cycles
+
+        The configuration file is checked with a cheap ``os.stat`` while
+        waiting; Ctrl+C interrupts the sleep immediately.
+
+        Returns:
+            True if the configuration file changed before the timeout elapsed
+        """
+        deadline = time.monotonic() + timeout
+        signature = self._config_signature()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(poll_interval, remaining))
+            if self._config_signature() != signature:
+                return True
     
     def get_enabled_players(self) -> List[Dict]:
-        """Get list of enabled players from configuration"""
-        return [p for p in self.players if p.get('enabled', True)]
+        """
+        Get list of enabled players from configuration
+
+        The list is built once per configuration load and shared between
+        callers, so it must not be modified.
+        """
+        return self._enabled_players
     
-    def extract_player_data(self, player_info: Dict) -> Dict:
+    def extract_player_data(self, player_info: Dict, crawler: Optional[FutbinCrawler] = None,
+                            timestamp: Optional[str] = None) -> Dict:
         """
         Extract data for a single player
         
         Args:
             player_info: Dictionary with player information from config
+            crawler: Crawler to use (defaults to the primary crawler)
+            timestamp: Timestamp to record (defaults to the current time)
             
         Returns:
             Extraction result dictionary
@@ -79,109 +201,265 @@ class ConfiguredFutbinCrawler:
         url = player_info['url']
         name = player_info.get('name', 'Unknown Player')
         
-        logger.info(f"Extracting data for: {name}")
+        logger.debug("Extracting data for: %s", name)
         
         try:
-            result = self.crawler.extract(url)
+            result = (crawler or self.crawler).extract(url)
+            data = result['data']
 
             # Add player name and timestamp to the result
+            if not data.get('player_name'):
+                data['player_name'] = name
+            data['configured_name'] = name
+            data['notes'] = player_info.get('notes', '')
             if result['success']:
-                if not result['data'].get('player_name'):
-                    result['data']['player_name'] = name
-                result['data']['configured_name'] = name
-                result['data']['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                result['data']['notes'] = player_info.get('notes', '')
-            else:
-                result['data']['player_name'] = result['data'].get('player_name') or name
-                result['data']['configured_name'] = name
-                result['data']['notes'] = player_info.get('notes', '')
+                data['timestamp'] = timestamp or time.strftime(TIMESTAMP_FORMAT)
 
             return result
             
         except Exception as e:
-            logger.error(f"Error extracting data for {name}: {e}")
+            logger.error("Error extracting data for %s: %s", name, e)
+            data = FutbinCrawler.empty_data()
+            data.update(player_name=name, configured_name=name, notes=player_info.get('notes', ''))
             return {
                 'success': False,
                 'error': str(e),
                 'url': url,
-                'data': {
-                    'player_name': name,
-                    'cheapest_sale': None,
-                    'actual_price': None,
-                    'average_price': None,
-                    'card_type': None,
-                    'card_rarity': None,
-                    'overall_rating': None,
-                    'position': None,
-                    'configured_name': name,
-                    'notes': player_info.get('notes', '')
-                }
+                'data': data
             }
     
-    @staticmethod
-    def _format_price(value: Optional[int]) -> str:
-        """Format integer price values with thousands separator"""
-        if value is None:
-            return "N/A"
+    def _get_crawler_pool(self, size: int) -> List[FutbinCrawler]:
+        """
+        Return ``size`` crawlers, creating extra browser instances on demand
 
-        try:
-            return f"{int(value):,}"
-        except (TypeError, ValueError):
-            return "N/A"
+        Selenium drivers are not thread-safe, so every concurrent extraction
+        gets its own crawler. The primary crawler is always the first entry.
+        """
+        headless = self.settings.get('headless_mode', False)
+        while len(self._extra_crawlers) < size - 1:
+            self._extra_crawlers.append(FutbinCrawler(headless=headless, page_cache=self._page_cache))
+        pool = [self.crawler] + self._extra_crawlers[:size - 1]
+
+        parse_pool = self._get_parse_pool()
+        use_selenium = self.settings.get('use_selenium', True)
+        http2 = self.settings.get('http2', False)
+        block_resources = self.settings.get('block_resources', True)
+        max_driver_uses = int(self.settings.get('max_driver_uses', 0))
+        profile_root = self.settings.get('chrome_profile_dir', '')
+        driver_path = self.settings.get('chromedriver_path') or None
+        version_main = int(self.settings.get('chrome_version_main') or 0) or None
+        for index, crawler in enumerate(pool):
+            crawler.parse_pool = parse_pool
+            crawler.use_selenium = use_selenium
+            crawler.http2 = http2
+            crawler.max_driver_uses = max_driver_uses
+            crawler.driver_executable_path = driver_path
+            crawler.version_main = version_main
+            # Only apply to browsers started after this point; every slot gets its
+            # own profile since Chrome refuses to share one between running browsers
+            crawler.block_resources = block_resources
+            crawler.profile_dir = None
+            if profile_root:
+                crawler.profile_dir = os.path.abspath(os.path.join(profile_root, f"slot-{index}"))
+        return pool
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Return the process pool used for HTML parsing, if ``parse_workers`` is set
+
+        Parsing is CPU-bound, so with several concurrency slots it is moved to
+        worker processes instead of competing for the GIL in the slot threads.
+        """
+        workers = min(int(self.settings.get('parse_workers', 0)), os.cpu_count() or 1)
+        if workers <= 0:
+            return None
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=workers)
+            logger.info("Parsing pages in %d worker processes", workers)
+        return self._parse_pool
+
+    def _print_result(self, result: Dict):
+        """Display the outcome of a single extraction"""
+        if result['success']:
+            get = result['data'].get
+            card_type = get('card_type')
+            card_rarity = get('card_rarity')
+            rating = get('overall_rating')
+            position = get('position')
+            lines = ["  ✅ Success!", f"     Player: {get('player_name', 'Unknown')}"]
+            if card_type or card_rarity:
+                card_details = card_type or card_rarity
+                if card_rarity and card_type and card_rarity not in card_type:
+                    card_details = f"{card_type} ({card_rarity})"
+                lines.append(f"     Card: {card_details}")
+            if rating or position:
+                lines.append(f"     Rating/Position: {rating or _NA} / {position or _NA}")
+            lines.append(f"     Cheapest: {_format_price(get('cheapest_sale'))}")
+            lines.append(f"     Avg BIN: {_format_price(get('actual_price'))}")
+            lines.append(f"     EA Avg: {_format_price(get('average_price'))}")
+        else:
+            lines = [f"  ❌ Failed: {result.get('error', 'Unknown error')}"]
 
-    def process_all_players(self, display_progress: bool = True) -> List[Dict]:
+        # One write per player keeps output intact when slots finish concurrently
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def process_all_players(self, display_progress: bool = True, players: Optional[List[Dict]] = None,
+                            timestamp: Optional[str] = None,
+                            on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
         """
         Process all enabled players from configuration
         
+        Args:
+            display_progress: Print per-player progress
+            players: Subset of players to process (defaults to all enabled players)
+            timestamp: Timestamp recorded for the whole batch (defaults to now)
+            on_result: Called with each result as soon as its extraction finishes
+
         Returns:
             List of extraction results
         """
-        enabled_players = self.get_enabled_players()
+        enabled_players = self.get_enabled_players() if players is None else players
         
         if not enabled_players:
             logger.warning("No enabled players found in configuration!")
             return []
         
-        results = []
+        timestamp = timestamp or datetime.now().strftime(TIMESTAMP_FORMAT)
+        return asyncio.run(self._process_players_async(enabled_players, display_progress, timestamp, on_result))
+
+    async def _process_players_async(self, players: List[Dict], display_progress: bool, timestamp: str,
+                                     on_result: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """
+        Extract players concurrently, one browser per concurrency slot
+
+        Each slot waits ``delay_between_requests`` after its own request before
+        picking up the next player, so politeness towards Futbin is kept per
+        browser while the waits overlap with other slots' page loads. When
+        ``requests_per_second`` is set, a shared rate limiter spaces request
+        starts across all slots instead and the per-slot delay is skipped.
+        With ``batch_size`` set, players are processed in groups of that size
+        with ``inter_batch_delay`` seconds of pause between groups.
+        """
+        total = len(players)
         delay = max(0, self.settings.get('delay_between_requests', 1))
-        
-        for i, player in enumerate(enabled_players, 1):
-            if display_progress:
-                print(f"\n[{i}/{len(enabled_players)}] Processing {player.get('name', 'Unknown')}...")
-            
-            # Extract data
-            result = self.extract_player_data(player)
-            results.append(result)
-            
-            # Display result
-            if display_progress:
-                if result['success']:
-                    data = result['data']
-                    print(f"  ✅ Success!")
-                    print(f"     Player: {data.get('player_name', 'Unknown')}")
-                    if data.get('card_type') or data.get('card_rarity'):
-                        card_details = data.get('card_type') or data.get('card_rarity')
-                        if data.get('card_rarity') and data.get('card_type') and data['card_rarity'] not in data['card_type']:
-                            card_details = f"{data['card_type']} ({data['card_rarity']})"
-                        print(f"     Card: {card_details}")
-                    if data.get('overall_rating') or data.get('position'):
-                        rating = data.get('overall_rating') or 'N/A'
-                        position = data.get('position') or 'N/A'
-                        print(f"     Rating/Position: {rating} / {position}")
-                    print(f"     Cheapest: {self._format_price(data.get('cheapest_sale'))}")
-                    print(f"     Avg BIN: {self._format_price(data.get('actual_price'))}")
-                    print(f"     EA Avg: {self._format_price(data.get('average_price'))}")
-                else:
-                    print(f"  ❌ Failed: {result.get('error', 'Unknown error')}")
+        concurrency = max(1, int(self.settings.get('concurrency', 1)))
+        requests_per_second = float(self.settings.get('requests_per_second', 0))
+        limiter = _RateLimiter(requests_per_second) if requests_per_second > 0 else None
+
+        slots = min(concurrency, total)
+        crawlers: asyncio.Queue = asyncio.Queue()
+        for crawler in self._get_crawler_pool(slots):
+            crawlers.put_nowait(crawler)
+
+        # A dedicated pool guarantees one thread per slot; the default executor is capped by CPU count
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=slots, thread_name_prefix='extract')
+
+        results: List[Optional[Dict]] = [None] * total
+        pending = total
+
+        async def extract_one(index: int, player: Dict):
+            nonlocal pending
+            crawler = await crawlers.get()
+            pending -= 1
+            try:
+                if limiter:
+                    await limiter.wait()
+
+                if display_progress:
+                    print(f"\n[{index + 1}/{total}] Processing {player.get('name', 'Unknown')}...")
+
+                # Extract data without blocking the other slots
+                result = await loop.run_in_executor(executor, self.extract_player_data, player, crawler, timestamp)
+                results[index] = result
+                if on_result:
+                    on_result(result)
 
-            # Add delay between requests (except for last player)
-            if i < len(enabled_players) and delay:
                 if display_progress:
-                    logger.info(f"Waiting {delay} seconds before next request...")
-                time.sleep(delay)
+                    self._print_result(result)
+
+                # Add delay before this browser's next request (skipped once the queue is drained)
+                if pending > 0 and delay and not limiter:
+                    if display_progress:
+                        logger.info("Waiting %s seconds before next request...", delay)
+                    await asyncio.sleep(delay)
+            finally:
+                crawlers.put_nowait(crawler)
+
+        batch_size = max(1, int(self.settings.get('batch_size', 0)) or total)
+        inter_batch_delay = max(0, self.settings.get('inter_batch_delay', 0))
+
+        try:
+            for start in range(0, total, batch_size):
+                if start and inter_batch_delay:
+                    await asyncio.sleep(inter_batch_delay)
+                end = min(start + batch_size, total)
+                await asyncio.gather(*(extract_one(i, players[i]) for i in range(start, end)))
+        finally:
+            # On Ctrl+C the cancelled tasks' threads may still be inside a page load;
+            # wait for them so cleanup() never closes a driver that is in use
+            executor.shutdown(wait=True, cancel_futures=True)
 
         return results
 
+    @staticmethod
+    def _find_opportunities(candidates: List[Tuple[str, str, int, Optional[int], Optional[int], Optional[float]]],
+                            profit_margin: float, drop_threshold: float) -> List[Dict]:
+        """
+        Select buy opportunities for a cycle in one pass over the collected prices
+
+        Args:
+            candidates: (name, url, cheapest, avg_bin, ea_avg, drop_pct) for each refreshed player
+            profit_margin: Minimum margin between cheapest and reference price
+            drop_threshold: Minimum drop versus the previous cycle
+
+        Returns:
+            Recommendations sorted by margin, then by drop
+        """
+        # (sort score, recommendation) pairs; the score is computed once per entry
+        scored = []
+
+        for name, url, cheapest, avg_bin, ea_avg, drop_pct in candidates:
+            # Average BIN is the preferred reference; fall back to EA Avg when missing
+            reference_price = avg_bin if avg_bin else ea_avg
+
+            margin = None
+            potential_profit = None
+            if cheapest and reference_price and reference_price > 0:
+                potential_profit = reference_price - cheapest
+                if potential_profit > 0:
+                    margin = potential_profit / reference_price
+
+            should_recommend = (
+                (margin and margin >= profit_margin)
+                or (drop_pct and drop_pct >= drop_threshold and potential_profit and potential_profit > 0)
+            )
+            if should_recommend:
+                scored.append(((margin or 0, drop_pct or 0), {
+                    'name': name,
+                    'cheapest': cheapest,
+                    'reference_price': reference_price,
+                    'margin': margin,
+                    'drop_pct': drop_pct,
+                    'url': url,
+                    'reference_label': 'Avg BIN' if avg_bin else 'EA Avg'
+                }))
+
+        scored.sort(key=itemgetter(0), reverse=True)
+        return [recommendation for _, recommendation in scored]
+
+    def _open_history(self) -> Optional[PriceHistory]:
+        """Open the price history database configured in settings (None when disabled)"""
+        db_file = self.settings.get('history_db', 'futbin_history.db')
+        if not db_file:
+            return None
+
+        try:
+            return PriceHistory(db_file)
+        except sqlite3.Error as e:
+            logger.warning("Price history disabled, could not open %s: %s", db_file, e)
+            return None
+
     def monitor_players(self) -> List[Dict]:
         """Continuously monitor enabled players and highlight buying opportunities"""
 
@@ -194,6 +472,7 @@ class ConfiguredFutbinCrawler:
         interval = max(10, int(self.settings.get('monitoring_interval_seconds', 300)))
         drop_threshold = float(self.settings.get('price_drop_threshold', 0.1))
         profit_margin = float(self.settings.get('target_profit_margin', 0.08))
+        max_backoff = max(0, int(self.settings.get('max_backoff_cycles', 0)))
 
         print("\n" + "=" * 70)
         print("CONTINUOUS PRICE MONITORING")
@@ -203,38 +482,86 @@ class ConfiguredFutbinCrawler:
         print(f"Highlighting drops ≥ {drop_threshold * 100:.1f}% and profit margins ≥ {profit_margin * 100:.1f}%.")
 
         previous_prices: Dict[str, Dict[str, Optional[int]]] = {}
+        latest_results: Dict[str, Dict] = {}
+
+        # Seed trends with prices stored by previous monitoring sessions; only prices
+        # from the last two intervals, so a restart days later does not compare live
+        # prices with stale ones and report false drops. Rows are stamped when their
+        # cycle started, so one interval would drop them if that cycle ran long or
+        # the monitor was stopped late in its wait
+        history = self._open_history()
+        if history:
+            seed_since = (datetime.now() - timedelta(seconds=2 * interval)).strftime(TIMESTAMP_FORMAT)
+            previous_prices.update(history.load_latest(since=seed_since))
+            if previous_prices:
+                print(f"Loaded previous prices for {len(previous_prices)} players from {history.db_file}.")
         iteration = 1
         last_results: List[Dict] = []
 
+        format_price = _format_price
+
+        # Cycles are scheduled on a fixed monotonic grid so the period does not drift
+        schedule_start = time.monotonic()
+        slot = 0
+
         try:
             while True:
-                cycle_started = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                # Pick up configuration edits (no-op when the file is unchanged); a file
+                # caught mid-save or briefly missing keeps the previous configuration
+                try:
+                    self.reload_config()
+                except (OSError, ValueError) as e:
+                    logger.warning("Could not reload configuration, keeping the previous one: %s", e)
+
+                cycle_started = datetime.now().strftime(TIMESTAMP_FORMAT)
                 print("\n" + "-" * 70)
                 print(f"🔄 Cycle {iteration} started at {cycle_started}")
 
-                results = self.process_all_players(display_progress=False)
-                last_results = results
+                # Players whose price has been stable are checked less often (max_backoff_cycles)
+                enabled_players = self.get_enabled_players()
+                previous_get = previous_prices.get
+                due_players = [
+                    p for p in enabled_players
+                    if iteration >= previous_get(p['url'], _NO_ENTRY).get('next_check_iteration', 0)
+                ]
+                skipped = len(enabled_players) - len(due_players)
+
+                results = []
+                if due_players:
+                    results = self.process_all_players(display_progress=False, players=due_players, timestamp=cycle_started)
+                for result in results:
+                    latest_results[result.get('url', '')] = result
+                last_results = [latest_results[p['url']] for p in enabled_players if p['url'] in latest_results]
+
+                # Persist this cycle while the next one is fetching
+                if results:
+                    self.save_in_background(results, last_results)
+
+                if skipped:
+                    print(f"  ⏭️ Skipped {skipped} player(s) with stable prices this cycle")
 
                 failures = [r for r in results if not r['success']]
 
-                recommendations = []
+                candidates: List[Tuple[str, str, int, Optional[int], Optional[int], Optional[float]]] = []
+                history_rows = []
+                cycle_output: List[str] = []
 
+                output = cycle_output.append
                 for result in results:
                     url = result.get('url', '')
-                    data = result.get('data', {}) or {}
-                    name = data.get('configured_name') or data.get('player_name') or 'Unknown Player'
+                    get = (result.get('data') or _NO_ENTRY).get
+                    name = get('configured_name') or get('player_name') or 'Unknown Player'
 
                     if not result['success']:
                         error_msg = result.get('error', 'Unknown error')
-                        print(f"  ⚠️ {name}: Failed to refresh data ({error_msg})")
+                        output(f"  ⚠️ {name}: Failed to refresh data ({error_msg})")
                         continue
 
-                    cheapest = data.get('cheapest_sale')
-                    avg_bin = data.get('actual_price')
-                    ea_avg = data.get('average_price')
-                    reference_price = next((price for price in (avg_bin, ea_avg) if price), None)
+                    cheapest = get('cheapest_sale')
+                    avg_bin = get('actual_price')
+                    ea_avg = get('average_price')
 
-                    previous_entry = previous_prices.get(url)
+                    previous_entry = previous_get(url)
                     previous_price = previous_entry.get('cheapest') if previous_entry else None
 
                     change_symbol = "="
@@ -245,82 +572,143 @@ class ConfiguredFutbinCrawler:
                         if cheapest < previous_price:
                             drop_pct = (previous_price - cheapest) / previous_price
                             change_symbol = "↓"
-                            change_text = f"Down {drop_pct * 100:.1f}% ({self._format_price(previous_price)} → {self._format_price(cheapest)})"
+                            change_text = f"Down {drop_pct * 100:.1f}% ({format_price(previous_price)} → {format_price(cheapest)})"
                         elif cheapest > previous_price:
                             increase_pct = (cheapest - previous_price) / previous_price
                             change_symbol = "↑"
-                            change_text = f"Up {increase_pct * 100:.1f}% ({self._format_price(previous_price)} → {self._format_price(cheapest)})"
+                            change_text = f"Up {increase_pct * 100:.1f}% ({format_price(previous_price)} → {format_price(cheapest)})"
                         else:
                             change_text = "Unchanged"
 
-                    print(f"  {change_symbol} {name}")
-                    print(f"     Cheapest: {self._format_price(cheapest)} | Avg BIN: {self._format_price(avg_bin)} | EA Avg: {self._format_price(ea_avg)}")
+                    output(f"  {change_symbol} {name}")
+                    output(f"     Cheapest: {format_price(cheapest)} | Avg BIN: {format_price(avg_bin)} | EA Avg: {format_price(ea_avg)}")
                     if previous_price:
-                        print(f"     Trend: {change_text}")
-
-                    margin = None
-                    potential_profit = None
-                    if cheapest and reference_price and reference_price > 0:
-                        potential_profit = reference_price - cheapest
-                        if potential_profit > 0:
-                            margin = potential_profit / reference_price
-
-                    if margin and margin >= profit_margin:
-                        recommendations.append({
-                            'name': name,
-                            'cheapest': cheapest,
-                            'reference_price': reference_price,
-                            'margin': margin,
-                            'drop_pct': drop_pct,
-                            'url': url,
-                            'reference_label': 'Avg BIN' if reference_price == avg_bin else 'EA Avg'
-                        })
-                    elif drop_pct and drop_pct >= drop_threshold and potential_profit and potential_profit > 0:
-                        recommendations.append({
-                            'name': name,
-                            'cheapest': cheapest,
-                            'reference_price': reference_price,
-                            'margin': margin,
-                            'drop_pct': drop_pct,
-                            'url': url,
-                            'reference_label': 'Avg BIN' if reference_price == avg_bin else 'EA Avg'
-                        })
+                        output(f"     Trend: {change_text}")
 
                     if cheapest:
+                        candidates.append((name, url, cheapest, avg_bin, ea_avg, drop_pct))
+                        history_rows.append((url, cycle_started, cheapest, avg_bin, ea_avg))
+
+                        unchanged_cycles = previous_entry.get('unchanged_cycles', 0) + 1 if cheapest == previous_price else 0
+                        next_check = 1
+                        if unchanged_cycles and max_backoff:
+                            next_check = min(2 ** unchanged_cycles, max_backoff)
                         previous_prices[url] = {
                             'cheapest': cheapest,
-                            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                            'timestamp': cycle_started,
+                            'unchanged_cycles': unchanged_cycles,
+                            'next_check_iteration': iteration + next_check
                         }
 
+                # Emit the whole cycle's per-player output in one write
+                if cycle_output:
+                    sys.stdout.write("\n".join(cycle_output) + "\n")
+
+                if history:
+                    history.record(history_rows)
+
                 if failures:
                     print(f"\n  ⚠️ {len(failures)} player(s) failed in this cycle. See logs for details.")
 
+                recommendations = self._find_opportunities(candidates, profit_margin, drop_threshold)
+
                 if recommendations:
                     print("\n  💡 Potential buy opportunities detected:")
-                    recommendations.sort(key=lambda x: (x['margin'] or 0, x['drop_pct'] or 0), reverse=True)
                     for rec in recommendations:
                         margin_text = f"{rec['margin'] * 100:.1f}%" if rec['margin'] is not None else "N/A"
                         drop_text = f" | Drop {rec['drop_pct'] * 100:.1f}%" if rec['drop_pct'] is not None else ""
-                        ref_price = self._format_price(rec['reference_price'])
-                        print(f"   - {rec['name']}: {self._format_price(rec['cheapest'])} vs {rec['reference_label']} {ref_price} (Margin {margin_text}{drop_text})")
+                        ref_price = format_price(rec['reference_price'])
+                        print(f"   - {rec['name']}: {format_price(rec['cheapest'])} vs {rec['reference_label']} {ref_price} (Margin {margin_text}{drop_text})")
                         if rec['url']:
                             print(f"     URL: {rec['url']}")
                 else:
                     print("\n  No buy signals this cycle based on configured thresholds.")
 
-                print(f"\n✅ Cycle {iteration} complete. Next check in {interval} seconds...")
+                slot += 1
+                remaining = schedule_start + slot * interval - time.monotonic()
+                if remaining <= 0:
+                    missed = int(-remaining // interval) + 1
+                    logger.warning("Cycle %d overran the %ds interval, skipping %d scheduled check(s)", iteration, interval, missed)
+                    slot += missed
+                    remaining = schedule_start + slot * interval - time.monotonic()
+
+                print(f"\n✅ Cycle {iteration} complete. Next check in {remaining:.0f} seconds...")
                 iteration += 1
 
-                time.sleep(interval)
+                if self._wait_for_next_cycle(max(0, remaining)):
+                    print("\n📝 Configuration file changed, starting next cycle now...")
+                    schedule_start = time.monotonic()
+                    slot = 0
 
         except KeyboardInterrupt:
             print("\n\n🛑 Monitoring stopped by user. Preparing final summary...")
         except Exception as e:
-            logger.error(f"Monitoring stopped due to error: {e}")
+            logger.error("Monitoring stopped due to error: %s", e)
             print(f"\n❌ Monitoring stopped due to error: {e}")
+        finally:
+            if history:
+                history.close()
 
         return last_results
     
+    @staticmethod
+    def _csv_row(result: Dict) -> List:
+        """Map a successful extraction result to a CSV row (ordered like CSV_HEADERS)"""
+        get = result['data'].get
+        return [get(key, '') for _, key in CSV_FIELDS] + [result.get('url', '')]
+
+    @staticmethod
+    def _result_columns(results: List[Dict], missing: Optional[str] = '') -> Dict[str, List]:
+        """
+        Collect successful results column by column, keyed by CSV header
+
+        Args:
+            results: List of extraction results
+            missing: Value used for fields absent from a result
+
+        Returns:
+            Mapping of each CSV header to the list of its values
+        """
+        successful = [result for result in results if result['success']]
+        data_gets = [result['data'].get for result in successful]
+        columns = {header: [get(key, missing) for get in data_gets] for header, key in CSV_FIELDS}
+        columns['url'] = [result.get('url', '') for result in successful]
+        return columns
+
+    def process_and_stream(self, filename: Optional[str] = None) -> List[Dict]:
+        """
+        Process all enabled players, appending each success to the CSV as it finishes
+
+        Rows are flushed one by one, so an interrupted run keeps every player
+        extracted so far.
+
+        Args:
+            filename: CSV filename (uses config default if not provided)
+
+        Returns:
+            List of extraction results
+        """
+        if filename is None:
+            filename = self.settings.get('csv_filename', 'futbin_prices.csv')
+
+        file_exists = os.path.exists(filename)
+        with open(filename, 'a' if file_exists else 'w', newline='', encoding='utf-8',
+                  buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            if not file_exists:
+                writer.writerow(CSV_HEADERS)
+
+            def write_result(result: Dict):
+                if result['success']:
+                    writer.writerow(self._csv_row(result))
+                    f.flush()
+                    self._sync_if_configured(f)
+
+            results = self.process_all_players(on_result=write_result)
+
+        logger.info("✅ Results saved to %s", filename)
+        return results
+
     def save_to_csv(self, results: List[Dict], filename: Optional[str] = None):
         """
         Save results to CSV file
@@ -339,43 +727,61 @@ class ConfiguredFutbinCrawler:
         # Check if file exists
         file_exists = os.path.exists(filename)
         
-        # Define CSV headers
-        headers = [
-            'timestamp', 'player_name', 'configured_name', 'card_type', 'card_rarity',
-            'overall_rating', 'position', 'cheapest_sale',
-            'average_bin', 'ea_avg_price', 'notes', 'url'
-        ]
-        
-        # Write to CSV
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
+        columns = self._result_columns(results)
+
+        # Append to CSV so price history is kept across runs
+        with open(filename, 'a' if file_exists else 'w', newline='', encoding='utf-8',
+                  buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
             
             # Write header if new file
             if not file_exists:
-                writer.writeheader()
+                writer.writerow(CSV_HEADERS)
             
-            # Write data rows
-            for result in results:
-                if result['success']:
-                    data = result['data']
-                    row = {
-                        'timestamp': data.get('timestamp', ''),
-                        'player_name': data.get('player_name', ''),
-                        'configured_name': data.get('configured_name', ''),
-                        'card_type': data.get('card_type', ''),
-                        'card_rarity': data.get('card_rarity', ''),
-                        'overall_rating': data.get('overall_rating', ''),
-                        'position': data.get('position', ''),
-                        'cheapest_sale': data.get('cheapest_sale', ''),
-                        'average_bin': data.get('actual_price', ''),
-                        'ea_avg_price': data.get('average_price', ''),
-                        'notes': data.get('notes', ''),
-                        'url': result.get('url', '')
-                    }
-                    writer.writerow(row)
+            # Rows are zipped straight from the columns
+            writer.writerows(zip(*(columns[header] for header in CSV_HEADERS)))
+            self._sync_if_configured(f)
         
-        logger.info(f"✅ Results saved to {filename}")
+        logger.info("✅ Results saved to %s", filename)
     
+    def save_to_parquet(self, results: List[Dict], directory: Optional[str] = None):
+        """
+        Save successful results as a new Parquet file in a dataset directory
+
+        Each call writes one zstd-compressed part file, so the directory keeps
+        the same history as the appended CSV and can be loaded as one dataset
+        (e.g. ``pyarrow.dataset.dataset(directory)``). Requires pyarrow.
+
+        Args:
+            results: List of extraction results
+            directory: Dataset directory (uses config default if not provided)
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.error("Parquet output requires pyarrow (pip install pyarrow)")
+            return
+
+        columns = self._result_columns(results, missing=None)
+        if not columns['url']:
+            logger.warning("No results to save")
+            return
+
+        if directory is None:
+            directory = self.settings.get('parquet_dir', 'futbin_prices_parquet')
+        os.makedirs(directory, exist_ok=True)
+
+        price_columns = {'cheapest_sale', 'average_bin', 'ea_avg_price'}
+        table = pa.table({
+            header: pa.array(columns[header], type=pa.int64() if header in price_columns else pa.string())
+            for header in CSV_HEADERS
+        })
+        filename = os.path.join(directory, f"prices-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.parquet")
+        pq.write_table(table, filename, compression='zstd')
+        
+        logger.info("✅ Results saved to %s", filename)
+
     def save_to_json(self, results: List[Dict], filename: str = "extraction_results.json"):
         """
         Save results to JSON file
@@ -384,11 +790,90 @@ class ConfiguredFutbinCrawler:
             results: List of extraction results
             filename: JSON filename
         """
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Serialize first and write once; json.dump would issue a write per token.
+        # Output is compact unless json_indent is configured.
+        indent = self.settings.get('json_indent')
+        separators = None if indent else (',', ':')
+        payload = json.dumps(results, indent=indent, separators=separators, ensure_ascii=False)
+        with open(filename, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(payload)
+            self._sync_if_configured(f)
         
-        logger.info(f"✅ Results saved to {filename}")
+        logger.info("✅ Results saved to %s", filename)
     
+    def save_to_ndjson(self, results: List[Dict], filename: Optional[str] = None):
+        """
+        Append results to a newline-delimited JSON file, one result per line
+
+        Unlike the JSON snapshot the file is only ever appended to, so every
+        save costs just the new results and the history streams line by line.
+
+        Args:
+            results: List of extraction results
+            filename: NDJSON filename (uses config default if not provided)
+        """
+        if not results:
+            logger.warning("No results to save")
+            return
+
+        if filename is None:
+            filename = self.settings.get('ndjson_filename', 'extraction_results.ndjson')
+
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        with open(filename, 'a', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(encode(result) + "\n" for result in results)
+            self._sync_if_configured(f)
+
+        logger.info("✅ Results saved to %s", filename)
+
+    def _sync_if_configured(self, f):
+        """Force written data to disk when fsync_on_write is enabled"""
+        if self.settings.get('fsync_on_write', False):
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _writer_loop(self):
+        """Run queued save jobs until the stop sentinel is received"""
+        while True:
+            job = self._write_queue.get()
+            if job is None:
+                break
+
+            save, args = job
+            try:
+                save(*args)
+            except Exception as e:
+                logger.error("Background save failed: %s", e)
+
+    def save_in_background(self, results: List[Dict], snapshot: Optional[List[Dict]] = None):
+        """
+        Queue results to be saved on the writer thread
+
+        Args:
+            results: Results appended to the CSV file
+            snapshot: Results written to the JSON file (defaults to ``results``)
+        """
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="futbin-writer", daemon=True)
+            self._writer_thread.start()
+
+        if self.settings.get('save_to_csv', True):
+            self._write_queue.put((self.save_to_csv, (results,)))
+        if self.settings.get('save_to_parquet', False):
+            self._write_queue.put((self.save_to_parquet, (results,)))
+        if self.settings.get('save_to_ndjson', False):
+            self._write_queue.put((self.save_to_ndjson, (results,)))
+        self._write_queue.put((self.save_to_json, (snapshot if snapshot is not None else results,)))
+
+    def flush_writes(self):
+        """Wait for queued saves to complete and stop the writer thread"""
+        if self._writer_thread is None:
+            return
+
+        self._write_queue.put(None)
+        self._writer_thread.join()
+        self._writer_thread = None
+
     def generate_report(self, results: List[Dict]):
         """
         Generate a summary report
@@ -396,50 +881,80 @@ class ConfiguredFutbinCrawler:
         Args:
             results: List of extraction results
         """
-        print("\n" + "="*70)
-        print("EXTRACTION REPORT")
-        print("="*70)
-        
         successful = [r for r in results if r['success']]
         failed = [r for r in results if not r['success']]
-        
-        print(f"\nTotal processed: {len(results)}")
-        print(f"✅ Successful: {len(successful)}")
-        print(f"❌ Failed: {len(failed)}")
+
+        # The report is assembled first and written with a single call
+        lines = [
+            "",
+            "=" * 70,
+            "EXTRACTION REPORT",
+            "=" * 70,
+            "",
+            f"Total processed: {len(results)}",
+            f"✅ Successful: {len(successful)}",
+            f"❌ Failed: {len(failed)}"
+        ]
+        add = lines.append
         
         if successful:
-            print("\n" + "-"*40)
-            print("SUCCESSFUL EXTRACTIONS")
-            print("-"*40)
+            lines += ["", "-" * 40, "SUCCESSFUL EXTRACTIONS", "-" * 40]
             
             for result in successful:
                 data = result['data']
-                print(f"\n{data['player_name']}:")
-                if data.get('card_type') or data.get('card_rarity'):
-                    print(f"  Card: {data.get('card_type') or data.get('card_rarity')}")
-                if data.get('overall_rating') or data.get('position'):
-                    print(f"  Rating/Position: {data.get('overall_rating', 'N/A')} / {data.get('position', 'N/A')}")
-                print(f"  Cheapest Sale: {data['cheapest_sale']:,}" if data['cheapest_sale'] else "  Cheapest Sale: N/A")
-                print(f"  Average BIN: {data['actual_price']:,}" if data['actual_price'] else "  Average BIN: N/A")
-                print(f"  EA Avg Price: {data['average_price']:,}" if data['average_price'] else "  EA Avg Price: N/A")
-                if data.get('notes'):
-                    print(f"  Notes: {data['notes']}")
+                get = data.get
+                add(f"\n{data['player_name']}:")
+                if get('card_type') or get('card_rarity'):
+                    add(f"  Card: {get('card_type') or get('card_rarity')}")
+                if get('overall_rating') or get('position'):
+                    add(f"  Rating/Position: {get('overall_rating', 'N/A')} / {get('position', 'N/A')}")
+                add(f"  Cheapest Sale: {data['cheapest_sale']:,}" if data['cheapest_sale'] else "  Cheapest Sale: N/A")
+                add(f"  Average BIN: {data['actual_price']:,}" if data['actual_price'] else "  Average BIN: N/A")
+                add(f"  EA Avg Price: {data['average_price']:,}" if data['average_price'] else "  EA Avg Price: N/A")
+                if get('notes'):
+                    add(f"  Notes: {data['notes']}")
         
         if failed:
-            print("\n" + "-"*40)
-            print("FAILED EXTRACTIONS")
-            print("-"*40)
+            lines += ["", "-" * 40, "FAILED EXTRACTIONS", "-" * 40]
             
             for result in failed:
                 failed_name = result['data'].get('player_name') or result['data'].get('configured_name') or 'Unknown'
-                print(f"\n{failed_name}:")
-                print(f"  Error: {result.get('error', 'Unknown error')}")
+                add(f"\n{failed_name}:")
+                add(f"  Error: {result.get('error', 'Unknown error')}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def cleanup(self):
         """Clean up resources"""
+        self.flush_writes()
+        for crawler in self._extra_crawlers:
+            crawler.close()
         if self.crawler:
             self.crawler.close()
             logger.info("Crawler closed")
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+
+
+def _start_log_listener() -> QueueListener:
+    """
+    Route log records through a queue so console I/O happens on a listener thread
+
+    Extraction slots and the monitor loop only enqueue records; formatting and
+    writing to stderr is done by the returned listener, which must be stopped
+    before exit to flush the remaining records.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = QueueListener(log_queue, stream_handler)
+    # The queue handler only merges the message arguments; the listener adds time and level
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)
+    listener.start()
+    return listener
 
 
 def main():
@@ -448,6 +963,8 @@ def main():
     print("\n" + "="*70)
     print("FUTBIN CRAWLER - JSON CONFIGURATION")
     print("="*70)
+
+    log_listener = _start_log_listener()
     
     try:
         # Initialize crawler with config
@@ -456,11 +973,10 @@ def main():
         if crawler.settings.get('continuous_monitoring', False):
             last_results = crawler.monitor_players()
 
-            if last_results:
-                if crawler.settings.get('save_to_csv', True):
-                    crawler.save_to_csv(last_results)
+            # Every completed cycle was saved in the background; wait for pending writes
+            crawler.flush_writes()
 
-                crawler.save_to_json(last_results)
+            if last_results:
                 crawler.generate_report(last_results)
 
                 print("\n" + "="*70)
@@ -475,15 +991,19 @@ def main():
                 print("Check your configuration and try again.")
                 print("="*70)
         else:
-            # Process all enabled players
-            results = crawler.process_all_players()
+            # Process all enabled players, streaming rows to the CSV if configured
+            if crawler.settings.get('save_to_csv', True):
+                results = crawler.process_and_stream()
+            else:
+                results = crawler.process_all_players()
 
             # Generate report
             crawler.generate_report(results)
 
-            # Save results if configured
-            if crawler.settings.get('save_to_csv', True):
-                crawler.save_to_csv(results)
+            if crawler.settings.get('save_to_parquet', False):
+                crawler.save_to_parquet(results)
+            if crawler.settings.get('save_to_ndjson', False):
+                crawler.save_to_ndjson(results)
 
             # Also save to JSON for complete data
             crawler.save_to_json(results)
@@ -496,7 +1016,7 @@ def main():
             print("="*70)
         
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         print(f"\n❌ Fatal error: {e}")
     
     finally:
@@ -505,6 +1025,7 @@ def main():
             crawler.cleanup()
         except:
             pass
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -4,40 +4,407 @@ Futbin Player Market Crawler - Working Version
 Successfully extracts player market data from Futbin.com
 """
 
+import atexit
 import json
+import queue
 import re
+import threading
 import time
-from typing import Dict, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchWindowException, TimeoutException, WebDriverException
+)
+import lxml.html
+from lxml import etree
+
+from page_cache import PageCache
+
+# Optional HTTP/2 backend for browser-free fetches (pip install "httpx[http2]")
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional fast JSON encoder for saved results (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Transport errors of every HTTP backend in use
+_HTTP_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+# Patterns used for every parsed page, compiled once at import
+_IMG_TAG_RE = re.compile(r'<img.*?>', re.IGNORECASE)
+# First number in a noisy price text, with a K/M suffix that is not the start of a word
+_PRICE_TOKEN_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([KkMm](?![A-Za-z]))?')
+_SUFFIX_MULTIPLIERS = {'K': 1000, 'k': 1000, 'M': 1000000, 'm': 1000000}
+# Separators and currency symbols removed by the price fast path
+_PRICE_DROP_CHARS = str.maketrans('', '', ', \t\n\r\xa0£$€¥₹')
+_NON_DIGIT_RE = re.compile(r'[^0-9]')
+_WHITESPACE_RE = re.compile(r"\s+")
+_SEPARATORS_RE = re.compile(r"[_-]+")
+# Card words kept in capitals by FutbinCrawler._format_card_text
+_SPECIAL_CARD_TOKENS = frozenset({"TOTW", "TOTS", "TOTY", "UCL", "OTW", "ICON", "HERO", "WC"})
+_CARD_KEYWORD_RE = re.compile(r'(Gold|Silver|Bronze|Icon|Hero|Promo|Rare|Common|Special)[^.,;]*', re.IGNORECASE)
+_DESCRIPTION_NAME_RE = re.compile(r'([^,\-]+)')
+# Card metadata in the page's embedded JSON, as (field, patterns in priority order). Keys are
+# matched case-insensitively, so cardType/cardtype is one pattern; version stays a separate,
+# lower-priority pattern rather than an alternation, which would take whichever comes first
+_JSON_FIELD_PATTERNS = [
+    (field, [(key.lower(), re.compile(rf'"{key}"\s*:\s*"?([^"\n\r]+?)"?[,}}]', re.IGNORECASE)) for key in keys])
+    for field, keys in (
+        ('card_type', ['cardType', 'version']),
+        ('card_rarity', ['rarity']),
+        ('overall_rating', ['rating']),
+        ('position', ['position'])
+    )
+]
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains ``name``"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath queries evaluated by lxml in C, compiled once at import
+# Market grid price containers as (field, label, container class)
+_PRICE_CONTAINERS = (
+    ('cheapest_sale', 'Cheapest Sale', 'market-grid-cheapest-sale'),
+    ('actual_price', 'Average BIN', 'market-grid-average-bin'),
+    ('average_price', 'EA Avg. Price', 'market-grid-ea-avg')
+)
+_GRID_TITLE_CLASS = 'market-grid-container-title'
+# The three price containers and the grid title labels are all found in a single pass over the document
+_PRICE_GRID_XPATH = etree.XPath(
+    "//div["
+    + " or ".join(_has_class(name) for name in [c for _, _, c in _PRICE_CONTAINERS] + [_GRID_TITLE_CLASS])
+    + "]"
+)
+_CONTAINER_PRICE_XPATH = etree.XPath(f".//div[{_has_class('standard-font')}][1]")
+# Grid title labels, one alternation whose matching group names the price field
+_PRICE_LABEL_RE = re.compile(r'(?P<cheapest_sale>Cheapest Sale)|(?P<actual_price>Average BIN)|(?P<average_price>EA Avg)')
+_PRICE_LABELS = {field: label for field, label, _ in _PRICE_CONTAINERS}
+_GRID_TITLE_PRICE_XPATH = etree.XPath(
+    f"ancestor::div[contains(@class, 'market-grid-')][1]//div[{_has_class('standard-font')}][1]"
+)
+_STRUCTURED_DATA_XPATH = etree.XPath("//script[@type='application/ld+json']/text()")
+# JSON-LD objects that describe the page rather than the card, never read for card metadata
+_NON_CARD_TYPES = frozenset({'BreadcrumbList', 'ListItem', 'ItemList', 'WebSite', 'WebPage',
+                             'Organization', 'SearchAction'})
+_CARD_JSON_KEYS = frozenset(key for _, keys in _JSON_FIELD_PATTERNS for key, _ in keys)
+_NAME_ELEMENT_XPATH = etree.XPath(f"(//*[{_has_class('player-name')}] | //*[{_has_class('pcdisplay-name')}] | //h1)[1]")
+
+# Returns the price texts of the market grid together with the HTML to parse (saving a separate
+# page_source round trip), or null until at least one price is rendered. Once every price is
+# known, only the metadata sources are sent back: <head>, the player name element and the
+# inline scripts holding the card JSON, instead of the whole serialized document.
+_MARKET_PRICES_JS = """
+if (!document.querySelector('div.market-grid-container')) {
+    return null;
+}
+const prices = {};
+const titles = document.querySelectorAll('div.market-grid-container-title');
+for (const [field, container, label] of [
+    ['cheapest_sale', 'market-grid-cheapest-sale', 'Cheapest Sale'],
+    ['actual_price', 'market-grid-average-bin', 'Average BIN'],
+    ['average_price', 'market-grid-ea-avg', 'EA Avg']
+]) {
+    let elem = document.querySelector('div.' + container + ' div.standard-font');
+    // Same fallback as the HTML parser: the price next to the grid title with this label
+    for (const title of titles) {
+        if (elem) {
+            break;
+        }
+        if (title.textContent.includes(label)) {
+            const grid = title.parentElement && title.parentElement.closest('div[class*="market-grid-"]');
+            elem = grid && grid.querySelector('div.standard-font');
+        }
+    }
+    prices[field] = elem ? elem.textContent.trim() : null;
+}
+if (!Object.values(prices).some(Boolean)) {
+    return null;
+}
+if (!Object.values(prices).every(Boolean)) {
+    return {prices: prices, html: document.documentElement.outerHTML};
+}
+const parts = [];
+const name = document.querySelector('.player-name, .pcdisplay-name, h1');
+if (name) {
+    parts.push(name.outerHTML);
+}
+for (const script of document.querySelectorAll('body script:not([src])')) {
+    parts.push(script.outerHTML);
+}
+const head = document.head ? document.head.outerHTML : '';
+return {prices: prices, html: '<html>' + head + '<body>' + parts.join('') + '</body></html>'};
+"""
+
+
+def _parse_html(page_source: str) -> Optional[lxml.html.HtmlElement]:
+    """Parse page HTML into an lxml tree (None for empty or unparsable documents)"""
+    if not page_source:
+        return None
+    try:
+        return lxml.html.fromstring(page_source)
+    except ValueError:
+        # Unicode strings with an XML encoding declaration must be parsed as bytes
+        return lxml.html.fromstring(page_source.encode('utf-8'))
+    except etree.ParserError as e:
+        logger.warning(f"Could not parse page HTML: {e}")
+        return None
+
+
+def _element_text(elem: lxml.html.HtmlElement) -> str:
+    """Text of an element with each text node stripped, like BeautifulSoup's get_text(strip=True)"""
+    if not len(elem):
+        # Leaf elements (the usual price and title divs) hold a single text node
+        return (elem.text or "").strip()
+    return "".join(text.strip() for text in elem.itertext())
+
+
+def _structured_data(tree: lxml.html.HtmlElement) -> Dict[str, object]:
+    """
+    Decode the card object of the page's JSON-LD blocks
+
+    Only top-level objects (or entries of an ``@graph``) that carry one of the card
+    keys are read, and only their own scalar values: navigation types such as a
+    BreadcrumbList, whose ListItem entries have a numeric ``position``, are skipped.
+
+    Returns:
+        Mapping of every lowercased key to its first scalar value, in document order
+        (empty when no card object is found, so the page scan is used instead)
+    """
+    found = {}
+    for text in _STRUCTURED_DATA_XPATH(tree):
+        try:
+            block = json.loads(text)
+        except ValueError:
+            continue
+        objects = block if isinstance(block, list) else [block]
+        for obj in list(objects):
+            if isinstance(obj, dict) and isinstance(obj.get('@graph'), list):
+                objects.extend(obj['@graph'])
+        for obj in objects:
+            if not isinstance(obj, dict):
+                continue
+            types = obj.get('@type')
+            types = types if isinstance(types, list) else [types]
+            if _NON_CARD_TYPES.intersection(t for t in types if isinstance(t, str)):
+                continue
+            values = {key.lower(): item for key, item in obj.items()
+                      if item is not None and not isinstance(item, (bool, dict, list))}
+            if _CARD_JSON_KEYS.isdisjoint(values):
+                continue
+            for key, item in values.items():
+                found.setdefault(key, item)
+    return found
+
+
+def _meta_tags(tree: lxml.html.HtmlElement) -> Dict[Tuple[str, str], Optional[str]]:
+    """
+    Collect the page's <meta> tags in one walk
+
+    Returns:
+        Mapping of ('property', value) and ('name', value) to the content of the
+        first tag with that attribute (None when that tag has no content)
+    """
+    metas = {}
+    for meta in tree.iter('meta'):
+        content = meta.get('content')
+        for attribute in ('property', 'name'):
+            value = meta.get(attribute)
+            if value is not None:
+                metas.setdefault((attribute, value), content)
+    return metas
+
+
+def _meta_content(metas: Dict[Tuple[str, str], Optional[str]], prop: str, name: str) -> Optional[str]:
+    """Content of the first <meta property=prop>, falling back to <meta name=name>"""
+    content = metas.get(('property', prop))
+    if content is None:
+        content = metas.get(('name', name))
+    return content
+
+
+def _scale_decimal(number: str, multiplier: int) -> Optional[int]:
+    """
+    Scale a plain decimal like "54.5" by a K/M multiplier in integer arithmetic
+
+    Floats would turn "2.01K" into 2009. Returns None when ``number`` is not of
+    the digits.digits form.
+    """
+    whole, dot, fraction = number.partition('.')
+    if not dot or not fraction.isdigit() or not (whole.isdigit() or not whole):
+        return None
+    scale = 10 ** len(fraction)
+    return (int(whole or 0) * scale + int(fraction)) * multiplier // scale
+
+
+@lru_cache(maxsize=2048)
+def _parse_price_text(text) -> Optional[int]:
+    """
+    Parse price text to integer (see FutbinCrawler._parse_price)
+
+    Memoized: the same price strings recur across players and monitoring cycles.
+    """
+    if not text:
+        return None
+    
+    try:
+        # Fast path for the usual "54500" / "54,500" / "54.5K" / "£1.2M" forms:
+        # one C-level pass drops separators, whitespace and currency symbols
+        text = str(text)
+        cleaned = text.translate(_PRICE_DROP_CHARS)
+        if cleaned.isdigit():
+            return int(cleaned)
+
+        multiplier = _SUFFIX_MULTIPLIERS.get(cleaned[-1:])
+        if multiplier:
+            cleaned = cleaned[:-1]
+        else:
+            multiplier = 1
+        if cleaned.isdigit():
+            return int(cleaned) * multiplier
+        scaled = _scale_decimal(cleaned, multiplier)
+        if scaled is not None:
+            return scaled
+        try:
+            return int(float(cleaned) * multiplier)
+        except (ValueError, OverflowError):
+            pass  # Anything else (markup, labels) goes through the token scan below
+
+        # Markup or labels around the price: take the first number and its suffix
+        # instead of gluing every digit in the text together
+        match = _PRICE_TOKEN_RE.search(_IMG_TAG_RE.sub('', text))
+        if match:
+            number, suffix = match.groups()
+            number = number.replace(',', '')
+            multiplier = _SUFFIX_MULTIPLIERS.get(suffix, 1)
+            scaled = _scale_decimal(number, multiplier)
+            return scaled if scaled is not None else int(number) * multiplier
+            
+    except (ValueError, AttributeError) as e:
+        logger.debug(f"Could not parse price from '{text}': {e}")
+    
+    return None
+
+
+@lru_cache(maxsize=512)
+def _format_card_words(value: str) -> Optional[str]:
+    """
+    Format a card type/rarity value (see FutbinCrawler._format_card_text)
+
+    Memoized like _parse_price_text: the same few card types ("Gold Rare",
+    "TOTW") repeat on almost every page.
+    """
+    cleaned = _SEPARATORS_RE.sub(" ", value).strip()
+    if not cleaned:
+        return None
+
+    formatted_tokens = []
+    for token in cleaned.split():
+        upper_token = token.upper()
+        if upper_token in _SPECIAL_CARD_TOKENS:
+            formatted_tokens.append(upper_token)
+        else:
+            formatted_tokens.append(token.capitalize())
+
+    return " ".join(formatted_tokens)
+
 
 class FutbinCrawler:
     """
     Working Futbin player market data crawler
     """
+
+    USER_AGENT = (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/122.0.0.0 Safari/537.36"
+    )
+    PRICE_FIELDS = ('cheapest_sale', 'actual_price', 'average_price')
+    METADATA_FIELDS = ('player_name', 'card_type', 'card_rarity', 'overall_rating', 'position')
+    # Template copied for every result instead of rebuilding the key tuple and dict
+    _EMPTY_DATA = dict.fromkeys(PRICE_FIELDS + METADATA_FIELDS)
+    
+    # Resources never needed to read prices; blocked when block_resources is enabled
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.css", "*.mp4", "*.webm",
+        "*googletagmanager*", "*google-analytics*", "*doubleclick*", "*googlesyndication*"
+    ]
     
-    def __init__(self, headless: bool = False, timeout: int = 15):
+    # Seconds between market readiness checks; each is one cheap script call, and the
+    # default 0.5 s poll would leave up to half a second idle after the prices render
+    READY_POLL_INTERVAL = 0.1
+    
+    # Statuses meaning Futbin refuses browser-free requests (bot challenge, rate limit),
+    # and how long (seconds) the crawler then goes straight to the browser
+    HTTP_BLOCKED_STATUSES = (403, 429, 503)
+    HTTP_BLOCK_BACKOFF = 300
+    
+    # HTTP/2 client shared by all crawlers so concurrent fetches multiplex one connection
+    _http2_client = None
+    _http2_lock = threading.Lock()
+    
+    def __init__(self, headless: bool = False, timeout: int = 15, parse_pool: Optional[Executor] = None,
+                 use_selenium: bool = True, block_resources: bool = True, http2: bool = False,
+                 max_driver_uses: int = 0, profile_dir: Optional[str] = None,
+                 driver_executable_path: Optional[str] = None, version_main: Optional[int] = None,
+                 page_cache: Optional[PageCache] = None):
         """
         Initialize the crawler
         
         Args:
             headless: Run browser in headless mode
             timeout: Maximum wait time for page elements (seconds)
+            parse_pool: Optional process pool used to parse page HTML off this thread
+            use_selenium: Always load pages in the browser; when False a plain HTTP
+                request is tried first and the browser is only used as a fallback
+            block_resources: Skip images, fonts, stylesheets and analytics in the browser
+            http2: Use an HTTP/2 httpx client for browser-free fetches when httpx is installed
+            max_driver_uses: Restart Chrome after this many page loads to keep its
+                memory in check (0 keeps the same browser for the crawler's lifetime)
+            profile_dir: Persistent Chrome profile directory, so its HTTP cache and
+                cookies survive browser restarts (None uses a throwaway profile).
+                Only one running browser may use a given directory.
+            driver_executable_path: Local chromedriver to use instead of having
+                undetected-chromedriver check for and download one on every launch
+            version_main: Chrome major version the driver must match (detected when None)
+            page_cache: Cache of recent extractions; a fresh entry is returned
+                without loading the page (None always loads it)
         """
         self.headless = headless
         self.timeout = timeout
+        self.parse_pool = parse_pool
+        self.use_selenium = use_selenium
+        self.block_resources = block_resources
+        self.http2 = http2
+        self.max_driver_uses = max_driver_uses
+        self.profile_dir = profile_dir
+        self.driver_executable_path = driver_executable_path
+        self.version_main = version_main
+        self.page_cache = page_cache
         self.driver = None
+        self._driver_uses = 0
+        self._session: Optional[requests.Session] = None
+        self._http_blocked_until = 0.0
+        self._helpers: List['FutbinCrawler'] = []
     
     def _setup_driver(self):
         """Setup Chrome driver with undetected-chromedriver"""
@@ -50,13 +417,50 @@ class FutbinCrawler:
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
+            # Keep Chrome's own logging quiet; it is never read and only costs I/O
+            options.add_argument("--log-level=3")
+            options.add_argument("--disable-logging")
+            # get() returns at DOMContentLoaded; extract() then waits for the prices
+            # themselves instead of every image, ad and iframe
+            options.page_load_strategy = 'eager'
             
             if self.headless:
                 options.add_argument("--headless=new")
+
+            if self.block_resources:
+                # Belt and braces with the CDP URL blocks below: Blink never decodes images
+                options.add_argument("--blink-settings=imagesEnabled=false")
+                options.add_experimental_option("prefs", {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2
+                })
+            
+            # Every WebDriver command (get, readiness polls) reuses one connection to chromedriver
+            chrome_kwargs = {'keep_alive': True}
+            if self.profile_dir:
+                # Warm HTTP cache, cookies and HSTS state from previous runs
+                chrome_kwargs['user_data_dir'] = self.profile_dir
+                # Room for Futbin's scripts and styles across runs (100 MB)
+                options.add_argument("--disk-cache-size=104857600")
+            if self.driver_executable_path:
+                # A pinned driver is patched once and kept, so launches skip the download check
+                chrome_kwargs['driver_executable_path'] = self.driver_executable_path
+            if self.version_main:
+                chrome_kwargs['version_main'] = self.version_main
             
             logger.info("Initializing Chrome driver...")
-            self.driver = uc.Chrome(options=options)
+            self.driver = uc.Chrome(options=options, **chrome_kwargs)
             logger.info("Chrome driver initialized successfully")
+
+            if self.block_resources:
+                try:
+                    self.driver.execute_cdp_cmd("Network.enable", {})
+                    self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
+                except Exception as e:
+                    logger.warning(f"Could not block page resources, loading them normally: {e}")
+
+            # The driver is reused for every extraction; make sure it is not leaked on exit
+            atexit.register(self.close)
             
         except Exception as e:
             logger.error(f"Failed to setup Chrome driver: {e}")
@@ -72,245 +476,389 @@ class FutbinCrawler:
         Returns:
             Price as integer or None
         """
-        if not text:
-            return None
-        
-        try:
-            # Clean the text
-            text = str(text).strip().upper()
-            
-            # Remove currency symbols and coin image references
-            text = re.sub(r'[£$€¥₹]', '', text)
-            text = re.sub(r'\<img.*?\>', '', text)  # Remove HTML img tags
-            
-            # Handle K and M suffixes
-            multiplier = 1
-            if 'M' in text:
-                multiplier = 1000000
-                text = text.replace('M', '')
-            elif 'K' in text:
-                multiplier = 1000
-                text = text.replace('K', '')
-            
-            # Remove all non-numeric except decimal point
-            text = re.sub(r'[^\d.]', '', text)
-            
-            if text:
-                # Convert to float first, then to int
-                value = float(text) * multiplier
-                return int(value)
-                
-        except (ValueError, AttributeError) as e:
-            logger.debug(f"Could not parse price from '{text}': {e}")
-        
-        return None
+        return _parse_price_text(text)
     
+    @classmethod
+    def empty_data(cls) -> Dict[str, Optional[object]]:
+        """Return a data dictionary with every price and metadata field set to None"""
+        return cls._EMPTY_DATA.copy()
+
     def _clean_text(self, value: Optional[str]) -> Optional[str]:
         """Utility method to normalize whitespace in extracted text"""
         if not value:
             return None
-        cleaned = re.sub(r"\s+", " ", value).strip()
+        cleaned = _WHITESPACE_RE.sub(" ", value).strip()
         return cleaned or None
 
     def _format_card_text(self, value: Optional[str]) -> Optional[str]:
         """Format card related values like rarity/type into readable text"""
         if not value:
             return None
+        return _format_card_words(value)
 
-        special_tokens = {"TOTW", "TOTS", "TOTY", "UCL", "OTW", "ICON", "HERO", "WC"}
-        cleaned = re.sub(r"[_-]+", " ", value).strip()
-        if not cleaned:
-            return None
+    def _extract_player_metadata(self, tree: lxml.html.HtmlElement, page_source: str,
+                                 metadata: Optional[Dict[str, Optional[object]]] = None) -> Dict[str, Optional[str]]:
+        """
+        Extract player metadata such as name, card type and rarity
 
-        formatted_tokens = []
-        for token in cleaned.split():
-            upper_token = token.upper()
-            if upper_token in special_tokens:
-                formatted_tokens.append(upper_token)
-            else:
-                formatted_tokens.append(token.capitalize())
-
-        return " ".join(formatted_tokens)
-
-    def _extract_player_metadata(self, soup: BeautifulSoup, page_source: str) -> Dict[str, Optional[str]]:
-        """Extract player metadata such as name, card type and rarity"""
-
-        metadata = {
-            'player_name': None,
-            'card_type': None,
-            'card_rarity': None,
-            'overall_rating': None,
-            'position': None
-        }
+        Args:
+            tree: Parsed market page
+            page_source: HTML of the market page
+            metadata: Dictionary to fill in place (missing fields are left as they are);
+                a new one is created when None
+
+        Returns:
+            The filled metadata dictionary
+        """
+        if metadata is None:
+            metadata = dict.fromkeys(self.METADATA_FIELDS)
 
         def update(field: str, value: Optional[str]):
             if value and not metadata.get(field):
                 metadata[field] = value
 
-        # Attempt to extract player name from meta tags
-        title_meta = soup.find('meta', property='og:title') or soup.find('meta', attrs={'name': 'title'})
-        if title_meta and title_meta.get('content'):
-            title_content = title_meta['content'].split('|')[0]
-            update('player_name', self._clean_text(title_content))
+        # Attempt to extract player name from meta tags (collected once for all lookups)
+        metas = _meta_tags(tree)
+        title_content = _meta_content(metas, 'og:title', 'title')
+        if title_content:
+            update('player_name', self._clean_text(title_content.split('|')[0]))
 
         # Fallback to header elements on the page
         if not metadata['player_name']:
-            name_elem = soup.select_one('.player-name, .pcdisplay-name, h1')
-            if name_elem:
-                update('player_name', self._clean_text(name_elem.get_text()))
+            name_elems = _NAME_ELEMENT_XPATH(tree)
+            if name_elems:
+                name_elem = name_elems[0]
+                # A leaf heading holds a single text node; only nested markup needs a subtree walk
+                name_text = name_elem.text if not len(name_elem) else name_elem.text_content()
+                update('player_name', self._clean_text(name_text))
 
         # Meta description often contains card type information
-        description_meta = soup.find('meta', property='og:description') or soup.find('meta', attrs={'name': 'description'})
-        description_text = description_meta.get('content') if description_meta else None
+        description_text = _meta_content(metas, 'og:description', 'description')
 
         if description_text:
             cleaned_description = self._clean_text(description_text)
             if cleaned_description:
                 # Attempt to extract card related keywords from the description
-                card_match = re.search(r'(Gold|Silver|Bronze|Icon|Hero|Promo|Rare|Common|Special)[^.,;]*', cleaned_description, re.IGNORECASE)
+                card_match = _CARD_KEYWORD_RE.search(cleaned_description)
                 if card_match:
                     update('card_type', self._format_card_text(card_match.group(0)))
 
                 if not metadata['player_name']:
-                    name_match = re.match(r'([^,\-]+)', cleaned_description)
+                    name_match = _DESCRIPTION_NAME_RE.match(cleaned_description)
                     if name_match:
                         update('player_name', self._clean_text(name_match.group(1)))
 
-        # Search the raw page source for JSON data that contains card metadata
-        json_fields = {
-            'card_type': ['cardtype', 'cardType', 'version'],
-            'card_rarity': ['rarity'],
-            'overall_rating': ['rating'],
-            'position': ['position']
-        }
-
-        for field, keys in json_fields.items():
-            for key in keys:
-                match = re.search(rf'"{key}"\s*:\s*"?([^"\n\r]+?)"?[,}}]', page_source, re.IGNORECASE)
-                if match:
-                    value = match.group(1)
-                    if field in {'card_type', 'card_rarity'}:
-                        value = self._format_card_text(value)
-                    elif field == 'overall_rating':
-                        value = re.sub(r'[^0-9]', '', value)
-                    update(field, self._clean_text(value))
+        # Card metadata per key in priority order: from the JSON-LD blocks (decoded
+        # once) when present, else from a scan of the raw page source for JSON data
+        structured = _structured_data(tree)
+        for field, keys in _JSON_FIELD_PATTERNS:
+            value = None
+            for key, pattern in keys:
+                value = structured.get(key)
+                if value is None:
+                    match = pattern.search(page_source)
+                    value = match.group(1) if match else None
+                if value is not None:
                     break
+            if value is not None:
+                value = str(value)
+                if field in {'card_type', 'card_rarity'}:
+                    value = self._format_card_text(value)
+                elif field == 'overall_rating':
+                    value = _NON_DIGIT_RE.sub('', value)
+                update(field, self._clean_text(value))
 
         return metadata
 
-    def extract(self, url: str) -> Dict[str, any]:
+    def parse_page(self, page_source: str, parse_prices: bool = True,
+                   parse_metadata: bool = True) -> Dict[str, Optional[object]]:
+        """
+        Parse prices and metadata from a market page
+
+        Args:
+            page_source: HTML of the player market page
+            parse_prices: Look for prices in the HTML; False when the caller
+                already read them from the live page and only needs metadata
+            parse_metadata: Extract the player metadata; False leaves it None
+                when only prices are needed
+
+        Returns:
+            Dictionary with prices and player metadata (missing values are None)
+        """
+        # Initialize data dictionary (actual_price is the Average BIN, average_price the EA Avg. Price)
+        data = self.empty_data()
+        if not (parse_prices or parse_metadata):
+            return data
+
+        tree = _parse_html(page_source)
+        if tree is None:
+            return data
+
+        if parse_prices:
+            self._parse_prices(tree, data)
+
+        if not parse_metadata:
+            return data
+
+        # Extract metadata such as player name and card type straight into the result
+        self._extract_player_metadata(tree, page_source, data)
+        return data
+
+    def _parse_prices(self, tree: lxml.html.HtmlElement, data: Dict[str, Optional[object]]):
+        """Fill the price fields of ``data`` from the market grid of a parsed page"""
+        # Find the first container of each price (Cheapest Sale, Average BIN, EA Avg. Price),
+        # keeping the grid titles from the same walk for the label fallback below
+        containers = {}
+        titles = []
+        for elem in _PRICE_GRID_XPATH(tree):
+            classes = elem.get('class', '').split()
+            if _GRID_TITLE_CLASS in classes:
+                titles.append(elem)
+            for field, _, container_class in _PRICE_CONTAINERS:
+                if container_class in classes:
+                    containers.setdefault(field, elem)
+
+        for field, label, _ in _PRICE_CONTAINERS:
+            container = containers.get(field)
+            if container is None:
+                continue
+            price_elems = _CONTAINER_PRICE_XPATH(container)
+            if price_elems:
+                data[field] = self._parse_price(_element_text(price_elems[0]))
+                logger.debug("Found %s: %s", label, data[field])
+        
+        # Alternative method: Search by text labels (only when a price is still missing)
+        if not all(data[field] for field in self.PRICE_FIELDS):
+            logger.debug("Trying alternative extraction method...")
+            
+            for title_div in titles:
+                label_match = _PRICE_LABEL_RE.search(_element_text(title_div))
+                if not label_match or data[label_match.lastgroup]:
+                    continue
+                field = label_match.lastgroup
+
+                # Find the price div within the title's market grid container
+                price_divs = _GRID_TITLE_PRICE_XPATH(title_div)
+                if price_divs:
+                    data[field] = self._parse_price(_element_text(price_divs[0]))
+                    logger.debug("Found %s (alt): %s", _PRICE_LABELS[field], data[field])
+
+    def _get_session(self) -> requests.Session:
+        """Return the keep-alive HTTP session used for browser-free fetches"""
+        if self._session is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": self.USER_AGENT})
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                                  max_retries=Retry(total=2, backoff_factor=0.3))
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
+    @classmethod
+    def _get_http2_client(cls):
+        """Return the shared HTTP/2 client, or None when httpx/h2 are not installed"""
+        if httpx is None:
+            return None
+        with cls._http2_lock:
+            if cls._http2_client is None:
+                try:
+                    client = httpx.Client(
+                        http2=True,
+                        headers={"User-Agent": cls.USER_AGENT},
+                        follow_redirects=True,
+                        limits=httpx.Limits(max_keepalive_connections=16)
+                    )
+                except ImportError as e:
+                    logger.warning(f"HTTP/2 unavailable, using requests instead: {e}")
+                    cls._http2_client = False
+                    return None
+                cls._http2_client = client
+                atexit.register(client.close)
+        return cls._http2_client or None
+
+    def _get_http_client(self):
+        """Return the client used for browser-free fetches"""
+        if self.http2:
+            client = self._get_http2_client()
+            if client is not None:
+                return client
+        return self._get_session()
+
+    def _share_browser_session(self):
+        """
+        Copy the browser's cookies and User-Agent into the HTTP client
+
+        Anti-bot clearance cookies are tied to the User-Agent that earned them,
+        so browser-free fetches send both and are less likely to be challenged.
+        """
+        try:
+            cookies = self.driver.get_cookies()
+            user_agent = self.driver.execute_script("return navigator.userAgent")
+        except WebDriverException as e:
+            logger.debug(f"Could not read browser cookies: {e}")
+            return
+
+        client = self._get_http_client()
+        for cookie in cookies:
+            client.cookies.set(cookie['name'], cookie['value'],
+                               domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+        if user_agent:
+            client.headers['User-Agent'] = user_agent
+
+    def _parse_source(self, page_source: str, parse_prices: bool = True,
+                      parse_metadata: bool = True) -> Dict[str, Optional[object]]:
+        """Parse page HTML, in a worker process when a pool is configured"""
+        if self.parse_pool is not None:
+            return self.parse_pool.submit(parse_market_html, page_source, parse_prices, parse_metadata).result()
+        return self.parse_page(page_source, parse_prices, parse_metadata)
+
+    def _extract_without_browser(self, url: str, parse_metadata: bool = True) -> Optional[Dict[str, Optional[object]]]:
+        """
+        Fetch and parse a market page with a plain HTTP request
+
+        Args:
+            url: Futbin player market URL
+            parse_metadata: Also extract the player metadata
+
+        Returns:
+            Extracted data, or None when the request failed or the static HTML
+            did not contain any price (the caller then falls back to the browser)
+        """
+        try:
+            logger.debug("Fetching URL without browser: %s", url)
+            response = self._get_http_client().get(url, timeout=self.timeout)
+        except _HTTP_ERRORS as e:
+            logger.warning(f"HTTP fetch failed, falling back to browser: {e}")
+            return None
+
+        if response.status_code != 200:
+            logger.warning(f"HTTP fetch returned status {response.status_code}, falling back to browser")
+            if response.status_code in self.HTTP_BLOCKED_STATUSES:
+                # Do not pay a doomed round trip before every browser load
+                self._http_blocked_until = time.monotonic() + self.HTTP_BLOCK_BACKOFF
+                logger.info(f"Using the browser only for the next {self.HTTP_BLOCK_BACKOFF} seconds")
+            return None
+
+        data = self._parse_source(response.text, parse_metadata=parse_metadata)
+        if not any(data[key] for key in self.PRICE_FIELDS):
+            logger.info("No prices in static HTML, falling back to browser")
+            return None
+        return data
+
+    def extract(self, url: str, fields: Optional[Tuple[str, ...]] = None) -> Dict[str, any]:
         """
         Extract player market data from Futbin URL
         
         Args:
             url: Futbin player market URL
+            fields: Data fields the caller needs (None for all); when no
+                metadata field is listed, the metadata pass is skipped and
+                those fields stay None
             
         Returns:
             Dictionary with success status and extracted data
         """
+        return self._load_page(url, self._wants_metadata(fields))()
+
+    def _wants_metadata(self, fields: Optional[Tuple[str, ...]]) -> bool:
+        """Whether an extraction of ``fields`` needs the player metadata"""
+        return fields is None or any(field in self.METADATA_FIELDS for field in fields)
+
+    def _load_page(self, url: str, parse_metadata: bool = True) -> Callable[[], Dict[str, any]]:
+        """
+        Fetch a market page, leaving the HTML parse for later
+
+        Returns:
+            Function returning the extraction result, so the parse can run
+            while the browser already loads the next page
+        """
         if 'futbin.com' not in url:
-            return {
+            result = {
                 'success': False,
                 'error': 'Invalid URL - must be a futbin.com URL',
-                'data': None
+                'data': self.empty_data()
             }
-        
+            return lambda: result
+
+        # A recent extraction of the same page skips the fetch (and the browser start) entirely
+        cached = self.page_cache.get(url) if self.page_cache else None
+        if cached is not None:
+            logger.debug("Using cached data for: %s", url)
+            result = {
+                'success': True,
+                'url': url,
+                'data': cached
+            }
+            return lambda: result
+
+        # Browser-free fast path; pages whose prices are rendered by JavaScript fall through
+        if not self.use_selenium and time.monotonic() >= self._http_blocked_until:
+            data = self._extract_without_browser(url, parse_metadata)
+            if data is not None:
+                # Only complete extractions are cached, so a hit always has the metadata
+                if self.page_cache and parse_metadata:
+                    self.page_cache.put(url, data)
+                result = {
+                    'success': True,
+                    'url': url,
+                    'data': data
+                }
+                return lambda: result
+
+        # Recycle a browser that has served its share of pages
+        if self.driver and self.max_driver_uses and self._driver_uses >= self.max_driver_uses:
+            logger.info(f"Restarting Chrome after {self._driver_uses} page loads")
+            self._quit_driver()
+
         self._setup_driver()
+        self._driver_uses += 1
         
         try:
-            logger.info(f"Loading URL: {url}")
+            logger.debug("Loading URL: %s", url)
             self.driver.get(url)
             
-            # Wait for page body and dynamic market grid content to load
-            wait = WebDriverWait(self.driver, self.timeout)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-
+            # Wait until the market grid shows a price; the readiness check also
+            # reads the rendered prices and the page HTML, one script call per poll
+            dom_prices = None
             try:
-                wait.until(lambda driver: driver.find_elements(By.CSS_SELECTOR, 'div.market-grid-container'))
+                wait = WebDriverWait(self.driver, self.timeout, poll_frequency=self.READY_POLL_INTERVAL)
+                market = wait.until(lambda driver: driver.execute_script(_MARKET_PRICES_JS))
+                dom_prices = market['prices']
+                page_source = market['html']
             except TimeoutException:
-                logger.warning("Market grid did not load within timeout, continuing with available content")
-
-            # Get page source and parse with BeautifulSoup
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-
-            # Initialize data dictionary
-            data = {
-                'cheapest_sale': None,
-                'actual_price': None,  # Average BIN
-                'average_price': None,  # EA Avg. Price
-                'player_name': None,
-                'card_type': None,
-                'card_rarity': None,
-                'overall_rating': None,
-                'position': None
-            }
-            
-            # Find Cheapest Sale
-            cheapest_container = soup.find('div', class_='market-grid-cheapest-sale')
-            if cheapest_container:
-                # Look for the price within the container
-                price_elem = cheapest_container.find('div', class_='standard-font')
-                if price_elem:
-                    price_text = price_elem.get_text(strip=True)
-                    data['cheapest_sale'] = self._parse_price(price_text)
-                    logger.info(f"Found Cheapest Sale: {data['cheapest_sale']}")
-            
-            # Find Average BIN
-            avg_bin_container = soup.find('div', class_='market-grid-average-bin')
-            if avg_bin_container:
-                # Look for the price within the container
-                price_elem = avg_bin_container.find('div', class_='standard-font')
-                if price_elem:
-                    price_text = price_elem.get_text(strip=True)
-                    data['actual_price'] = self._parse_price(price_text)
-                    logger.info(f"Found Average BIN: {data['actual_price']}")
-            
-            # Find EA Avg. Price
-            ea_avg_container = soup.find('div', class_='market-grid-ea-avg')
-            if ea_avg_container:
-                # Look for the price within the container
-                price_elem = ea_avg_container.find('div', class_='standard-font')
-                if price_elem:
-                    price_text = price_elem.get_text(strip=True)
-                    data['average_price'] = self._parse_price(price_text)
-                    logger.info(f"Found EA Avg. Price: {data['average_price']}")
-            
-            # Alternative method: Search by text labels
-            if not all(data.values()):
-                logger.info("Trying alternative extraction method...")
-                
-                # Find all divs with market grid container titles
-                title_divs = soup.find_all('div', class_='market-grid-container-title')
-                
-                for title_div in title_divs:
-                    title_text = title_div.get_text(strip=True)
-                    parent = title_div.find_parent('div', class_=re.compile('market-grid-'))
-                    
-                    if parent:
-                        # Find the price div within the parent
-                        price_div = parent.find('div', class_='standard-font')
-                        if price_div:
-                            price_text = price_div.get_text(strip=True)
-                            
-                            if 'Cheapest Sale' in title_text and not data['cheapest_sale']:
-                                data['cheapest_sale'] = self._parse_price(price_text)
-                                logger.info(f"Found Cheapest Sale (alt): {data['cheapest_sale']}")
-                            elif 'Average BIN' in title_text and not data['actual_price']:
-                                data['actual_price'] = self._parse_price(price_text)
-                                logger.info(f"Found Average BIN (alt): {data['actual_price']}")
-                            elif 'EA Avg' in title_text and not data['average_price']:
-                                data['average_price'] = self._parse_price(price_text)
-                                logger.info(f"Found EA Avg. Price (alt): {data['average_price']}")
-            
-            # Extract metadata such as player name and card type
-            metadata = self._extract_player_metadata(soup, page_source)
-            for key, value in metadata.items():
-                if value:
-                    data[key] = value
+                logger.warning("Market prices did not load within timeout, continuing with available content")
+                page_source = self.driver.page_source
+
+            # The browser got past the anti-bot checks; let the HTTP fast path reuse that
+            if not self.use_selenium:
+                self._share_browser_session()
+        except Exception as e:
+            if isinstance(e, (InvalidSessionIdException, NoSuchWindowException)):
+                # Drop the dead browser so the next extraction starts a fresh one
+                self._quit_driver()
+            result = self._failed_result(url, e)
+            return lambda: result
+
+        return lambda: self._parse_loaded_page(url, page_source, dom_prices, parse_metadata)
+
+    def _parse_loaded_page(self, url: str, page_source: str, dom_prices: Optional[Dict[str, Optional[str]]],
+                           parse_metadata: bool = True) -> Dict[str, any]:
+        """Build the extraction result from the HTML and live DOM prices of a loaded page"""
+        try:
+            # Parse the page HTML; when the live DOM already showed every price,
+            # only the metadata is needed from it (and only its sources were sent)
+            dom_complete = bool(dom_prices) and all(dom_prices.values())
+            data = self._parse_source(page_source, not dom_complete, parse_metadata)
+
+            # Fill prices the HTML parse missed (or skipped) from the live DOM
+            if dom_prices:
+                for field, price_text in dom_prices.items():
+                    if price_text and not data.get(field):
+                        data[field] = self._parse_price(price_text)
+                        logger.debug("Found %s: %s", _PRICE_LABELS[field], data[field])
 
             # Check if we got any price data (metadata alone does not count as success)
-            success = any(data[key] for key in ('cheapest_sale', 'actual_price', 'average_price'))
+            success = any(data[key] for key in self.PRICE_FIELDS)
 
             result = {
                 'success': success,
@@ -321,29 +869,125 @@ class FutbinCrawler:
             if not success:
                 logger.warning("Could not extract any price data")
                 result['error'] = "Failed to extract price data - page structure may have changed"
-            
+            elif self.page_cache and parse_metadata:
+                self.page_cache.put(url, data)
+
             return result
             
         except Exception as e:
-            logger.error(f"Extraction failed: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'url': url,
-                'data': {
-                    'cheapest_sale': None,
-                    'actual_price': None,
-                    'average_price': None,
-                    'player_name': None,
-                    'card_type': None,
-                    'card_rarity': None,
-                    'overall_rating': None,
-                    'position': None
-                }
-            }
+            return self._failed_result(url, e)
+
+    def _failed_result(self, url: str, error: Exception) -> Dict[str, any]:
+        """Log a failed extraction and return its result"""
+        logger.error(f"Extraction failed: {error}")
+        return {
+            'success': False,
+            'error': str(error),
+            'url': url,
+            'data': self.empty_data()
+        }
     
+    def extract_many(self, urls: List[str], workers: int = 1,
+                     fields: Optional[Tuple[str, ...]] = None, delay: float = 0) -> List[Dict[str, any]]:
+        """
+        Extract several player market URLs, with up to ``workers`` browsers in parallel
+
+        The first browser is this crawler's own; the others belong to helper
+        crawlers with the same options, kept until close() so later calls reuse
+        their running browsers. A URL that fails, even to start its browser,
+        gets a failed result and the others are still extracted.
+
+        Args:
+            urls: Futbin player market URLs
+            workers: Number of browsers extracting at the same time
+            fields: Data fields the caller needs, as for extract()
+            delay: Seconds each browser waits after a page before loading its next
+                one; the delay is per browser, so parallel browsers do not wait for each other
+
+        Returns:
+            Extraction results in the order of ``urls``
+        """
+        parse_metadata = self._wants_metadata(fields)
+
+        def throttle(finished_at: Optional[float]):
+            if finished_at is not None:
+                remaining = delay - (time.monotonic() - finished_at)
+                if remaining > 0:
+                    time.sleep(remaining)
+
+        workers = max(1, min(workers, len(urls)))
+        if workers == 1:
+            # Pipeline a single browser: each page is parsed on a worker thread
+            # while the browser is already loading the next one
+            pending = []
+            with ThreadPoolExecutor(max_workers=1) as parser:
+                finished_at = None
+                for url in urls:
+                    throttle(finished_at)
+                    pending.append(parser.submit(self._load_page_or_fail(url, parse_metadata)))
+                    finished_at = time.monotonic()
+            return [future.result() for future in pending]
+
+        while len(self._helpers) < workers - 1:
+            self._helpers.append(self._make_helper(len(self._helpers) + 1))
+
+        # Selenium drivers are not thread-safe: each thread takes a crawler for one URL,
+        # together with the time that crawler's previous page finished
+        idle = queue.Queue()
+        for crawler in [self] + self._helpers[:workers - 1]:
+            idle.put((crawler, None))
+
+        def run(url: str) -> Dict[str, any]:
+            crawler, finished_at = idle.get()
+            try:
+                throttle(finished_at)
+                return crawler._load_page_or_fail(url, parse_metadata)()
+            finally:
+                idle.put((crawler, time.monotonic()))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, urls))
+
+    def _load_page_or_fail(self, url: str, parse_metadata: bool = True) -> Callable[[], Dict[str, any]]:
+        """_load_page(), turning an error it raises (such as Chrome failing to start) into a failed result"""
+        try:
+            return self._load_page(url, parse_metadata)
+        except Exception as e:
+            result = self._failed_result(url, e)
+            return lambda: result
+
+    def _make_helper(self, index: int) -> 'FutbinCrawler':
+        """Create a crawler with this crawler's options for extract_many()"""
+        return FutbinCrawler(
+            headless=self.headless,
+            timeout=self.timeout,
+            parse_pool=self.parse_pool,
+            use_selenium=self.use_selenium,
+            block_resources=self.block_resources,
+            http2=self.http2,
+            max_driver_uses=self.max_driver_uses,
+            # A Chrome profile cannot be shared between running browsers
+            profile_dir=f"{self.profile_dir}-{index}" if self.profile_dir else None,
+            driver_executable_path=self.driver_executable_path,
+            version_main=self.version_main,
+            page_cache=self.page_cache
+        )
+
     def close(self):
-        """Close the browser driver"""
+        """
+        Close the HTTP session and quit the browser driver (and those of
+        the extract_many() helpers)
+        """
+        for helper in self._helpers:
+            helper.close()
+        self._helpers = []
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self._quit_driver()
+
+    def _quit_driver(self):
+        """Quit the browser driver"""
         if self.driver:
             try:
                 self.driver.quit()
@@ -352,6 +996,8 @@ class FutbinCrawler:
                 logger.error(f"Error closing browser: {e}")
             finally:
                 self.driver = None
+                self._driver_uses = 0
+                atexit.unregister(self.close)
     
     def __enter__(self):
         """Context manager support"""
@@ -362,6 +1008,31 @@ class FutbinCrawler:
         self.close()
 
 
+# Parser reused by every task a pool worker process runs
+_worker_parser: Optional[FutbinCrawler] = None
+
+
+def parse_market_html(page_source: str, parse_prices: bool = True,
+                      parse_metadata: bool = True) -> Dict[str, Optional[object]]:
+    """
+    Parse a market page inside a process pool worker
+
+    Kept at module level so it can be pickled by ProcessPoolExecutor. The
+    worker's crawler never starts a browser; it is only used for parsing.
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = FutbinCrawler()
+    return _worker_parser.parse_page(page_source, parse_prices, parse_metadata)
+
+
+def _dumps_indented(obj) -> str:
+    """Serialize to indented JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
+
 def main():
     """Main function with example usage"""
     
@@ -378,6 +1049,8 @@ def main():
         # Extract data from single URL
         print(f"Extracting data from: {url}\n")
         result = crawler.extract(url)
+        # Serialized once for both the saved file and the printed output
+        result_json = _dumps_indented(result)
         
         # Display results
         print("\n" + "-"*70)
@@ -400,8 +1073,8 @@ def main():
             print(f"📊 EA Avg. Price:  {format_price(data['average_price'])}")
             
             # Save to JSON
-            with open('player_market_data.json', 'w') as f:
-                json.dump(result, f, indent=2)
+            with open('player_market_data.json', 'w', encoding='utf-8') as f:
+                f.write(result_json)
             print("\n💾 Data saved to player_market_data.json")
             
         else:
@@ -410,7 +1083,7 @@ def main():
         
         print("\n" + "="*70)
         print("Full JSON output:")
-        print(json.dumps(result, indent=2))
+        print(result_json)
 
 
 if __name__ == "__main__":
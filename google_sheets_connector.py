@@ -12,10 +12,11 @@ from datetime import datetime
 from typing import List, Dict, Optional
 import logging
 import threading
-import signal
 
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 from googleapiclient.errors import HttpError
 
 from futbin_crawler_working import FutbinCrawler
@@ -25,11 +26,67 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
+def _price_cell(value):
+    """
+    Cell value for a price: a number Sheets can sort and compute with,
+    blank when the price was not found
+    """
+    if not value:
+        return ''
+    if isinstance(value, (int, float)):
+        return value
+    cleaned = str(value).replace(',', '').strip(' £€$')
+    try:
+        return int(cleaned)
+    except ValueError:
+        try:
+            return float(cleaned)
+        except ValueError:
+            return ''
+
+
+def _identity(value):
+    return value
+
+
+def _text_cell(value) -> str:
+    """
+    Cell value for free text (names, notes, URLs), kept as text under USER_ENTERED
+
+    A leading apostrophe stops Sheets from evaluating text that starts like a
+    formula (=, +, -, @) or converting text that starts with a digit to a
+    number or date; the apostrophe itself is not shown.
+    """
+    if value is None:
+        return ''
+    text = str(value)
+    if text and (text[0] in '=+-@' or text[0].isdigit()):
+        return "'" + text
+    return text
+
+
+# Sheet columns in order, as (result key, cell formatter). Prices become numbers
+# and the timestamp a date; everything else is written as literal text
+_ROW_SCHEMA = (
+    ('timestamp', _identity),
+    ('player_name', _text_cell),
+    ('cheapest_sale', _price_cell),
+    ('average_bin', _price_cell),
+    ('ea_avg_price', _price_cell),
+    ('notes', _text_cell),
+    ('url', _text_cell)
+)
+
+
 class GoogleSheetsConnector:
     """
     Connects Futbin Crawler to Google Sheets
     """
     
+    # Rate limit and server errors googleapiclient retries with exponential backoff
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    MAX_TRIES = 5
+    
     def __init__(self, 
                  credentials_file: str = "credentials.json",
                  spreadsheet_id: str = None,
@@ -51,6 +108,17 @@ class GoogleSheetsConnector:
         self.service = None
         self.crawler = None
         self.running = False
+        self._stop_event = threading.Event()
+        self._loop_thread: Optional[threading.Thread] = None
+        self._headers_ok = False
+        self._sheet_id: Optional[int] = None
+        
+        # Rows waiting for the next batched append (see push_to_sheets)
+        self._pending_rows: List[List] = []
+        self._pending_lock = threading.Lock()
+        # Serializes appends: the API client must not be used from two threads at once
+        self._flush_lock = threading.Lock()
+        self._last_flush = time.monotonic()
         
         # Load configuration
         self._load_config()
@@ -73,10 +141,10 @@ class GoogleSheetsConnector:
             if not self.spreadsheet_id:
                 raise ValueError("Spreadsheet ID not provided. Add it to player_links.json or pass as parameter")
                 
-            logger.info(f"Loaded {len(self.players)} players from configuration")
+            logger.info("Loaded %s players from configuration", len(self.players))
             
         except FileNotFoundError:
-            logger.error(f"Configuration file {self.config_file} not found!")
+            logger.error("Configuration file %s not found!", self.config_file)
             raise
     
     def _initialize_sheets_service(self):
@@ -84,7 +152,8 @@ class GoogleSheetsConnector:
         try:
             # Check if credentials file exists
             if not os.path.exists(self.credentials_file):
-                logger.error(f"""
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error("""
                 ❌ Google Sheets credentials not found!
                 
                 To set up Google Sheets integration:
@@ -93,9 +162,9 @@ class GoogleSheetsConnector:
                 2. Create a new project or select existing
                 3. Enable Google Sheets API
                 4. Create Service Account credentials
-                5. Download JSON key and save as '{self.credentials_file}'
+                5. Download JSON key and save as '%s'
                 6. Share your Google Sheet with the service account email
-                """)
+                """, self.credentials_file)
                 raise FileNotFoundError(f"Credentials file {self.credentials_file} not found")
             
             # Set up credentials
@@ -104,16 +173,48 @@ class GoogleSheetsConnector:
                 scopes=['https://www.googleapis.com/auth/spreadsheets']
             )
             
-            # Build the service
-            self.service = build('sheets', 'v4', credentials=creds)
+            # Build the service on one authorized keep-alive connection, reused by
+            # every API call of the scheduled cycles. The Sheets discovery document
+            # bundled with google-api-python-client is used, so start-up does not
+            # download it (nor write it to a file cache)
+            authed_http = AuthorizedHttp(creds, http=build_http())
+            self.service = build('sheets', 'v4', http=authed_http,
+                                 static_discovery=True, cache_discovery=False)
             logger.info("✅ Google Sheets API initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize Google Sheets API: {e}")
+            logger.error("Failed to initialize Google Sheets API: %s", e)
             raise
     
+    def _execute_with_retry(self, request):
+        """
+        Execute a Sheets API request, retrying rate limits and server errors
+
+        googleapiclient retries 429 and 5xx responses itself, sleeping with
+        randomized exponential backoff between attempts, so retries do not land
+        in the same quota window.
+
+        Args:
+            request: Prepared googleapiclient request
+
+        Returns:
+            The API response
+
+        Raises:
+            HttpError: For other errors, or once MAX_TRIES attempts have failed
+        """
+        return request.execute(num_retries=self.MAX_TRIES - 1)
+    
     def _setup_spreadsheet(self):
-        """Setup spreadsheet with headers if needed"""
+        """
+        Write the formatted header row (once per connector)
+
+        The sheet is looked up (or added) first, then the header values and
+        their formatting are written together in a single batchUpdate.
+        """
+        if self._headers_ok:
+            return
+        
         try:
             # Define headers
             headers = [
@@ -121,64 +222,69 @@ class GoogleSheetsConnector:
                 'Average BIN', 'EA Avg Price', 'Notes', 'URL'
             ]
             
-            # Try to read the first row
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f'{self.sheet_name}!A1:G1'
-            ).execute()
+            sheet_id = self._get_sheet_id()
+            if sheet_id is None:
+                logger.error("Skipping spreadsheet setup: sheet could not be found or created")
+                return
             
-            values = result.get('values', [])
+            logger.info("Setting up spreadsheet headers...")
             
-            # If no headers, add them
-            if not values or values[0] != headers:
-                logger.info("Setting up spreadsheet headers...")
-                
-                body = {'values': [headers]}
-                self.service.spreadsheets().values().update(
-                    spreadsheetId=self.spreadsheet_id,
-                    range=f'{self.sheet_name}!A1:G1',
-                    valueInputOption='RAW',
-                    body=body
-                ).execute()
-                
-                # Format headers (bold)
-                requests = [{
-                    'repeatCell': {
-                        'range': {
-                            'sheetId': self._get_sheet_id(),
-                            'startRowIndex': 0,
-                            'endRowIndex': 1
-                        },
-                        'cell': {
-                            'userEnteredFormat': {
-                                'textFormat': {'bold': True},
-                                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-                            }
-                        },
-                        'fields': 'userEnteredFormat(textFormat,backgroundColor)'
-                    }
-                }]
-                
-                self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=self.spreadsheet_id,
-                    body={'requests': requests}
-                ).execute()
-                
-                logger.info("✅ Headers added to spreadsheet")
+            # Header text and format (bold, grey background) in one request
+            header_format = {
+                'textFormat': {'bold': True},
+                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
+            }
+            requests = [{
+                'updateCells': {
+                    'range': {
+                        'sheetId': sheet_id,
+                        'startRowIndex': 0,
+                        'endRowIndex': 1,
+                        'startColumnIndex': 0,
+                        'endColumnIndex': len(headers)
+                    },
+                    'rows': [{
+                        'values': [
+                            {'userEnteredValue': {'stringValue': header}, 'userEnteredFormat': header_format}
+                            for header in headers
+                        ]
+                    }],
+                    'fields': 'userEnteredValue,userEnteredFormat(textFormat,backgroundColor)'
+                }
+            }]
+            
+            self._execute_with_retry(self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={'requests': requests}
+            ))
+            
+            logger.info("✅ Headers added to spreadsheet")
+            self._headers_ok = True
                 
         except Exception as e:
-            logger.error(f"Error setting up spreadsheet: {e}")
+            logger.error("Error setting up spreadsheet: %s", e)
     
-    def _get_sheet_id(self):
-        """Get the sheet ID for the specified sheet name"""
+    def _get_sheet_id(self) -> Optional[int]:
+        """
+        Get the sheet ID for the specified sheet name (looked up once per connector)
+
+        Returns:
+            Sheet ID, adding the sheet when it does not exist yet, or None on error
+        """
+        if self._sheet_id is not None:
+            return self._sheet_id
+        
         try:
-            spreadsheet = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id
-            ).execute()
+            # Only the sheet titles and IDs, not the whole spreadsheet metadata
+            spreadsheet = self._execute_with_retry(self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets.properties(sheetId,title)'
+            ))
             
             for sheet in spreadsheet['sheets']:
                 if sheet['properties']['title'] == self.sheet_name:
-                    return sheet['properties']['sheetId']
+                    self._sheet_id = sheet['properties']['sheetId']
+                    return self._sheet_id
             
             # If sheet doesn't exist, create it
             request = {
@@ -189,34 +295,50 @@ class GoogleSheetsConnector:
                 }
             }
             
-            response = self.service.spreadsheets().batchUpdate(
+            response = self._execute_with_retry(self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
                 body={'requests': [request]}
-            ).execute()
+            ))
             
-            return response['replies'][0]['addSheet']['properties']['sheetId']
+            self._sheet_id = response['replies'][0]['addSheet']['properties']['sheetId']
+            return self._sheet_id
             
         except Exception as e:
-            logger.error(f"Error getting sheet ID: {e}")
-            return 0
+            logger.error("Error getting sheet ID: %s", e)
+            return None
     
     def extract_player_data(self) -> List[Dict]:
-        """Extract data for all enabled players"""
+        """
+        Extract data for all enabled players
+
+        With ``"concurrency"`` above 1 in the settings, that many browsers extract
+        players in parallel (each in its own crawler, kept for later cycles).
+        """
         if not self.crawler:
             self.crawler = FutbinCrawler(headless=True)
         
         results = []
         enabled_players = [p for p in self.players if p.get('enabled', True)]
+        workers = int(self.settings.get('concurrency', 1))
+        
+        try:
+            logger.info("Extracting %s players with %s browser(s)", len(enabled_players), workers)
+            # Only prices are written to the sheet; skip the metadata pass
+            extracted = self.crawler.extract_many([p['url'] for p in enabled_players], workers=workers,
+                                                  fields=FutbinCrawler.PRICE_FIELDS)
+        except Exception as e:
+            logger.error("Error extracting players: %s", e)
+            return results
+        
+        # Every row of a cycle shares one timestamp
+        cycle_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        for player in enabled_players:
+        for player, result in zip(enabled_players, extracted):
             try:
-                logger.info(f"Extracting: {player['name']}")
-                result = self.crawler.extract(player['url'])
-                
                 if result['success']:
                     data = result['data']
                     results.append({
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                        'timestamp': cycle_timestamp,
                         'player_name': player['name'],
                         'cheapest_sale': data.get('cheapest_sale', ''),
                         'average_bin': data.get('actual_price', ''),
@@ -225,59 +347,75 @@ class GoogleSheetsConnector:
                         'url': player['url']
                     })
                 else:
-                    logger.warning(f"Failed to extract data for {player['name']}")
+                    logger.warning("Failed to extract data for %s", player['name'])
                     
             except Exception as e:
-                logger.error(f"Error extracting {player['name']}: {e}")
+                logger.error("Error extracting %s: %s", player['name'], e)
         
         return results
     
     def push_to_sheets(self, data: List[Dict]):
-        """Push extracted data to Google Sheets"""
+        """
+        Push extracted data to Google Sheets
+
+        Rows are buffered and written with a single append once
+        ``flush_batch_size`` rows are pending or ``flush_max_seconds`` have passed
+        since the last write (the default 0 writes every cycle).
+        """
         if not data:
             logger.warning("No data to push to sheets")
             return
         
-        try:
-            # Convert data to rows
-            rows = []
-            for item in data:
-                row = [
-                    item['timestamp'],
-                    item['player_name'],
-                    str(item['cheapest_sale']) if item['cheapest_sale'] else '',
-                    str(item['average_bin']) if item['average_bin'] else '',
-                    str(item['ea_avg_price']) if item['ea_avg_price'] else '',
-                    item['notes'],
-                    item['url']
-                ]
-                rows.append(row)
-            
-            # Get current data to find next empty row
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=f'{self.sheet_name}!A:A'
-            ).execute()
-            
-            current_rows = len(result.get('values', []))
-            next_row = current_rows + 1 if current_rows > 0 else 2  # Start from row 2 if headers exist
-            
-            # Append data
-            body = {'values': rows}
-            self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=f'{self.sheet_name}!A{next_row}',
-                valueInputOption='RAW',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
-            
-            logger.info(f"✅ Pushed {len(rows)} rows to Google Sheets")
+        # Convert data to rows
+        rows = [[format_cell(item[key]) for key, format_cell in _ROW_SCHEMA] for item in data]
+        
+        with self._pending_lock:
+            self._pending_rows.extend(rows)
+            pending = len(self._pending_rows)
+        
+        batch_size = int(self.settings.get('flush_batch_size', 50))
+        max_seconds = float(self.settings.get('flush_max_seconds', 0))
+        if pending < batch_size and time.monotonic() - self._last_flush < max_seconds:
+            logger.info("Buffered %s rows (%s pending) for the next Sheets write", len(rows), pending)
+            return
+        
+        self.flush_pending_rows()
+    
+    def flush_pending_rows(self):
+        """Write every buffered row to Google Sheets with one append call"""
+        with self._flush_lock:
+            # The buffer lock is only held to take the rows, so new rows can be
+            # buffered while the append (and its retry backoff) is running
+            with self._pending_lock:
+                rows = self._pending_rows
+                self._pending_rows = []
+            if not rows:
+                return
             
-        except HttpError as e:
-            logger.error(f"Google Sheets API error: {e}")
-        except Exception as e:
-            logger.error(f"Error pushing to sheets: {e}")
+            try:
+                # Append data; the API finds the row after the table itself
+                body = {'values': rows}
+                self._execute_with_retry(self.service.spreadsheets().values().append(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=f'{self.sheet_name}!A:G',
+                    # Prices are sent as numbers and the timestamp is read as a date
+                    valueInputOption='USER_ENTERED',
+                    insertDataOption='INSERT_ROWS',
+                    body=body
+                ))
+                
+                self._last_flush = time.monotonic()
+                logger.info("✅ Pushed %s rows to Google Sheets", len(rows))
+                
+            except HttpError as e:
+                logger.error("Google Sheets API error: %s", e)
+                if e.resp.status in self.RETRY_STATUSES:
+                    # Still rate limited after every retry: keep the rows for the next write
+                    with self._pending_lock:
+                        self._pending_rows[:0] = rows
+                    logger.info("Kept %s rows for the next Sheets write", len(rows))
+            except Exception as e:
+                logger.error("Error pushing to sheets: %s", e)
     
     def run_once(self):
         """Run extraction and push once"""
@@ -296,47 +434,63 @@ class GoogleSheetsConnector:
                 logger.warning("No data extracted")
                 
         except Exception as e:
-            logger.error(f"Error in run_once: {e}")
+            logger.error("Error in run_once: %s", e)
     
     def run_scheduled(self, interval_seconds: int = 30):
         """Run extraction on schedule"""
         self.running = True
+        self._stop_event.clear()
         
         # Setup the spreadsheet on first run
         self._setup_spreadsheet()
         
-        logger.info(f"🔄 Starting scheduled extraction every {interval_seconds} seconds")
+        logger.info("🔄 Starting scheduled extraction every %s seconds", interval_seconds)
         logger.info("Press Ctrl+C to stop")
         
         def run_loop():
+            # Cycles start every interval_seconds on a monotonic schedule, so the
+            # time spent extracting does not stretch the period
+            next_run = time.monotonic()
             while self.running:
                 try:
                     self.run_once()
-                    logger.info(f"⏰ Next extraction in {interval_seconds} seconds...")
-                    
-                    # Sleep in small intervals to allow for clean shutdown
-                    for _ in range(interval_seconds):
-                        if not self.running:
-                            break
-                        time.sleep(1)
-                        
                 except Exception as e:
-                    logger.error(f"Error in scheduled run: {e}")
-                    time.sleep(interval_seconds)
+                    logger.error("Error in scheduled run: %s", e)
+                
+                next_run += interval_seconds
+                now = time.monotonic()
+                if next_run <= now:
+                    # Overran the interval: start the next cycle now instead of catching up
+                    logger.warning("Extraction took longer than %s seconds", interval_seconds)
+                    next_run = now
+                logger.info("⏰ Next extraction in %.0f seconds...", next_run - now)
+                
+                # Wakes up as soon as stop() is called
+                self._stop_event.wait(next_run - now)
         
         # Run in thread
-        thread = threading.Thread(target=run_loop)
-        thread.start()
+        self._loop_thread = threading.Thread(target=run_loop)
+        self._loop_thread.start()
         
         try:
-            thread.join()
+            self._loop_thread.join()
         except KeyboardInterrupt:
             logger.info("\n🛑 Stopping scheduled extraction...")
             self.stop()
     
     def stop(self):
-        """Stop the scheduled extraction"""
+        """
+        Stop the scheduled extraction
+
+        Waits for a cycle in progress to finish, so its rows are included in the
+        final flush and the crawler is not closed while it is still extracting.
+        """
         self.running = False
+        self._stop_event.set()
+        thread = self._loop_thread
+        if thread and thread is not threading.current_thread():
+            thread.join()
+        self.flush_pending_rows()
         if self.crawler:
             self.crawler.close()
             logger.info("Crawler closed")
@@ -370,22 +524,14 @@ def main():
             config_file="player_links.json"
         )
         
-        # Handle Ctrl+C gracefully
-        def signal_handler(sig, frame):
-            print("\n\n🛑 Stopping crawler...")
-            connector.stop()
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        
-        # Run scheduled extraction
+        # Run scheduled extraction (Ctrl+C stops it through run_scheduled)
         connector.run_scheduled(interval_seconds=30)
         
     except FileNotFoundError as e:
         print(f"\n❌ {e}")
         print("\nPlease follow the setup instructions above to configure Google Sheets API")
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         print(f"\n❌ Fatal error: {e}")
 
 
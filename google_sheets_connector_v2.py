@@ -74,8 +74,9 @@ class GoogleSheetsConnectorV2:
                 scopes=['https://www.googleapis.com/auth/spreadsheets']
             )
             
-            # Build the service
-            self.service = build('sheets', 'v4', credentials=creds)
+            # Build the service from the bundled discovery document (no download at start-up)
+            self.service = build('sheets', 'v4', credentials=creds,
+                                 static_discovery=True, cache_discovery=False)
             logger.info("✅ Google Sheets API initialized successfully")
             
         except Exception as e:
@@ -291,6 +292,9 @@ class GoogleSheetsConnectorV2:
         self.load_players_from_sheets()
         
         results = []
+
+        # One timestamp for the whole batch, so a cycle's rows group together
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         for player in self.players:
             try:
@@ -300,7 +304,7 @@ class GoogleSheetsConnectorV2:
                 if result['success']:
                     data = result['data']
                     results.append({
-                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                        'timestamp': timestamp,
                         'player_name': player['name'],
                         'cheapest_sale': data.get('cheapest_sale', ''),
                         'average_bin': data.get('actual_price', ''),
@@ -9,9 +9,23 @@ import sys
 from typing import List, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import quote_plus
 
+# Overall rating digits in the players list, compiled once for every imported row
+_RATING_RE = re.compile(r"\d+")
+
+# The C-based lxml parser (pinned in requirements.txt)
+_SOUP_PARSER = "lxml"
+
+# Search results and listings are read from the players table only; the rest of the page is not built
+_TABLE_STRAINER = SoupStrainer("table")
+
+
+def _make_soup(html: str) -> BeautifulSoup:
+    """Parse the tables of a Futbin page"""
+    return BeautifulSoup(html, _SOUP_PARSER, parse_only=_TABLE_STRAINER)
+
 
 class PlayerManager:
     """
@@ -57,7 +71,7 @@ class PlayerManager:
                 print(f"❌ Futbin search failed with status code {response.status_code}")
                 return []
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = _make_soup(response.text)
             rows = soup.select("table tbody tr")
             results = []
 
@@ -95,7 +109,7 @@ class PlayerManager:
                 print(f"❌ Futbin listing request failed (page {page}) with status {response.status_code}")
                 return []
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = _make_soup(response.text)
             rows = soup.select("table tbody tr")
             players = []
 
@@ -135,7 +149,7 @@ class PlayerManager:
                 if rating_cell:
                     rating_text = rating_cell.get_text(strip=True)
                     if rating_text:
-                        match = re.search(r"\d+", rating_text)
+                        match = _RATING_RE.search(rating_text)
                         if match:
                             rating = int(match.group())
 
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Page Cache for Futbin Crawler
+Keeps recently extracted market data on disk so repeated runs skip the page load
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import logging
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PageCache:
+    """
+    URL-keyed cache of extracted market data with a time-to-live
+
+    Entries live in memory for the current run and as one JSON file per URL,
+    so a restart within the TTL does not reload the same pages.
+    """
+
+    def __init__(self, ttl_seconds: float, cache_dir: str = os.path.join(".cache", "futbin")):
+        """
+        Create the cache
+
+        Args:
+            ttl_seconds: How long an extraction stays valid
+            cache_dir: Directory holding the cached entries
+        """
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+        self._memory: Dict[str, Tuple[float, Dict]] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        """Return the cache file used for a URL"""
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + ".json")
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Return a copy of the cached data for a URL, if it is still fresh
+
+        Args:
+            url: Futbin player market URL
+
+        Returns:
+            Extracted data dictionary or None on a miss
+        """
+        now = time.time()
+        entry = self._memory.get(url)
+        if entry is None:
+            path = self._path(url)
+            try:
+                stored_at = os.path.getmtime(path)
+                if now - stored_at >= self.ttl_seconds:
+                    return None
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = (stored_at, json.load(f))
+            except (OSError, ValueError):
+                return None
+            self._memory[url] = entry
+
+        stored_at, data = entry
+        if now - stored_at >= self.ttl_seconds:
+            return None
+        return dict(data)
+
+    def put(self, url: str, data: Dict):
+        """
+        Store freshly extracted data for a URL
+
+        Args:
+            url: Futbin player market URL
+            data: Extracted data dictionary (copied, later changes are not cached)
+        """
+        data = dict(data)
+        self._memory[url] = (time.time(), data)
+
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not write page cache entry for %s: %s", url, e)
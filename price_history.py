@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Price History Store for Futbin Crawler
+Persists the latest and historical prices of each player in SQLite
+"""
+
+import sqlite3
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PriceHistory:
+    """
+    SQLite store of player prices that survives monitoring restarts
+    """
+
+    def __init__(self, db_file: str = "futbin_history.db"):
+        """
+        Open (or create) the price history database
+
+        Args:
+            db_file: Path to the SQLite database file
+        """
+        self.db_file = db_file
+        self.conn = sqlite3.connect(db_file, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS latest (
+                url TEXT PRIMARY KEY,
+                timestamp TEXT,
+                cheapest_sale INTEGER,
+                average_bin INTEGER,
+                ea_avg_price INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS history (
+                url TEXT,
+                timestamp TEXT,
+                cheapest_sale INTEGER,
+                average_bin INTEGER,
+                ea_avg_price INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS history_url ON history (url, timestamp);
+        """)
+
+    def load_latest(self, since: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Load the most recent cheapest price recorded for every URL
+
+        Args:
+            since: Only return prices recorded at or after this timestamp
+                ('%Y-%m-%d %H:%M:%S', compared as text); None returns all
+
+        Returns:
+            Mapping of URL to {'cheapest': ..., 'timestamp': ...}
+        """
+        rows = self.conn.execute(
+            "SELECT url, cheapest_sale, timestamp FROM latest "
+            "WHERE cheapest_sale IS NOT NULL AND timestamp >= ?",
+            (since or '',)
+        ).fetchall()
+        return {url: {'cheapest': cheapest, 'timestamp': timestamp} for url, cheapest, timestamp in rows}
+
+    def record(self, rows: List[Tuple[str, str, Optional[int], Optional[int], Optional[int]]]):
+        """
+        Store one cycle of prices in a single transaction
+
+        Args:
+            rows: (url, timestamp, cheapest_sale, average_bin, ea_avg_price) tuples
+        """
+        if not rows:
+            return
+
+        try:
+            self.conn.execute("BEGIN")
+            self.conn.executemany("INSERT OR REPLACE INTO latest VALUES (?, ?, ?, ?, ?)", rows)
+            self.conn.executemany("INSERT INTO history VALUES (?, ?, ?, ?, ?)", rows)
+            self.conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            logger.error("Could not record price history: %s", e)
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
@@ -6,7 +6,6 @@ Shows how to integrate the crawler with CSV files and potentially Google Sheets
 
 import csv
 import json
-import time
 from datetime import datetime
 from typing import List, Dict
 import os
@@ -19,15 +18,21 @@ class FutbinSpreadsheetIntegration:
     Example class showing spreadsheet integration
     """
     
+    # Seconds each browser waits between its own requests to avoid rate limiting
+    REQUEST_DELAY = 3
+    
     def __init__(self, csv_file: str = "futbin_prices.csv"):
         self.csv_file = csv_file
         self.crawler = FutbinCrawler(headless=False)
     
     def extract_player_data(self, url: str) -> Dict:
         """Extract data for a single player"""
-        result = self.crawler.extract(url)
-        
-        # Add timestamp and player name
+        # The player name is taken from the URL below, so only the prices are extracted
+        result = self.crawler.extract(url, fields=FutbinCrawler.PRICE_FIELDS)
+        return self._add_player_details(url, result)
+    
+    def _add_player_details(self, url: str, result: Dict) -> Dict:
+        """Add the player name, URL and timestamp to a successful extraction"""
         if result['success']:
             # Extract player name from URL
             player_name = url.split('/')[-2].replace('-', ' ').title()
@@ -75,35 +80,40 @@ class FutbinSpreadsheetIntegration:
         
         print(f"✅ Data saved to {self.csv_file}")
     
-    def process_multiple_players(self, urls: List[str]):
-        """Process multiple player URLs"""
-        results = []
+    def process_multiple_players(self, urls: List[str], workers: int = 1):
+        """
+        Process multiple player URLs
         
-        for i, url in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] Processing: {url}")
-            
-            try:
-                result = self.extract_player_data(url)
-                results.append(result)
-                
-                if result['success']:
-                    data = result['data']
-                    print(f"  ✅ {data['player_name']}")
-                    print(f"     Cheapest: {data['cheapest_sale']:,}" if data['cheapest_sale'] else "     Cheapest: N/A")
-                    print(f"     Avg BIN: {data['actual_price']:,}" if data['actual_price'] else "     Avg BIN: N/A")
-                    print(f"     EA Avg: {data['average_price']:,}" if data['average_price'] else "     EA Avg: N/A")
-                else:
-                    print(f"  ❌ Failed: {result.get('error', 'Unknown error')}")
-            
-            except Exception as e:
-                print(f"  ❌ Error: {e}")
-            
-            # Add delay between requests to avoid rate limiting
-            if i < len(urls):
-                time.sleep(3)
+        Args:
+            urls: Futbin player market URLs
+            workers: Number of browsers extracting in parallel (each runs its own Chrome)
+        
+        Returns:
+            Extraction results in the order of ``urls``
+        """
+        results = self.crawler.extract_many(urls, workers=workers,
+                                            fields=FutbinCrawler.PRICE_FIELDS,
+                                            delay=self.REQUEST_DELAY)
+        
+        for position, (url, result) in enumerate(zip(urls, results), 1):
+            self._add_player_details(url, result)
+            self._print_player(position, len(urls), url, result)
         
         return results
     
+    def _print_player(self, position: int, total: int, url: str, result: Dict):
+        """Print one player's summary"""
+        print(f"\n[{position}/{total}] Processing: {url}")
+        
+        if result['success']:
+            data = result['data']
+            print(f"  ✅ {data['player_name']}")
+            print(f"     Cheapest: {data['cheapest_sale']:,}" if data['cheapest_sale'] else "     Cheapest: N/A")
+            print(f"     Avg BIN: {data['actual_price']:,}" if data['actual_price'] else "     Avg BIN: N/A")
+            print(f"     EA Avg: {data['average_price']:,}" if data['average_price'] else "     EA Avg: N/A")
+        else:
+            print(f"  ❌ Failed: {result.get('error', 'Unknown error')}")
+    
     def generate_price_report(self):
         """Generate a summary report from the CSV file"""
         if not os.path.exists(self.csv_file):
@@ -114,37 +124,31 @@ class FutbinSpreadsheetIntegration:
         print("PRICE REPORT")
         print("="*70)
         
+        # Only each player's first and latest entry are reported, so the history
+        # is streamed once instead of being loaded and grouped row by row
+        players = {}
         with open(self.csv_file, 'r') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+            for row in csv.DictReader(f):
+                first, _ = players.get(row['player_name'], (row, None))
+                players[row['player_name']] = (first, row)
         
-        if not rows:
+        if not players:
             print("No data in CSV file")
             return
         
-        # Group by player
-        players = {}
-        for row in rows:
-            name = row['player_name']
-            if name not in players:
-                players[name] = []
-            players[name].append(row)
-        
         # Display summary for each player
-        for player_name, entries in players.items():
+        for player_name, (first, latest) in players.items():
             print(f"\n{player_name}")
             print("-" * 40)
             
-            # Get latest entry
-            latest = entries[-1]
+            # Latest entry
             print(f"Latest prices ({latest['timestamp']}):")
             print(f"  Cheapest Sale: {latest['cheapest_sale']}")
             print(f"  Average BIN: {latest['average_bin']}")
             print(f"  EA Avg Price: {latest['ea_avg_price']}")
             
             # Calculate price changes if multiple entries
-            if len(entries) > 1:
-                first = entries[0]
+            if latest is not first:
                 try:
                     cheapest_change = int(latest['cheapest_sale'] or 0) - int(first['cheapest_sale'] or 0)
                     avg_change = int(latest['average_bin'] or 0) - int(first['average_bin'] or 0)